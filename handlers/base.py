@@ -3,10 +3,13 @@
 import json
 import logging
 import os
+import random
 import re
+import time
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from functools import wraps
 
@@ -21,11 +24,19 @@ T = TypeVar('T')
 # =============================================================================
 _clients: Dict[str, Any] = {}
 
+# Shared client config: larger keep-alive pool for fan-out handlers, TCP keep-alive
+# so pooled connections survive idle gaps between warm invocations, adaptive retries
+_BOTO_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+
 
 def _get_client(name: str, service: str = None):
     """Lazy client initialization with caching."""
     if name not in _clients:
-        _clients[name] = boto3.client(service or name)
+        _clients[name] = boto3.client(service or name, config=_BOTO_CONFIG)
     return _clients[name]
 
 
@@ -33,7 +44,7 @@ def _get_resource(name: str, service: str = None):
     """Lazy resource initialization with caching."""
     key = f"resource_{name}"
     if key not in _clients:
-        _clients[key] = boto3.resource(service or name)
+        _clients[key] = boto3.resource(service or name, config=_BOTO_CONFIG)
     return _clients[key]
 
 
@@ -57,13 +68,19 @@ def get_table():
 
 
 # Convenience aliases - call as functions: table(), social(), s3(), sns()
-def table(): return get_table()
+table = get_table
 def social(): return get_social()
 def s3(): return get_s3()
 def sns(): return get_sns()
 def ec2(): return get_ec2()
 def iam(): return get_iam()
 
+# Inside Lambda, build the hot-path table and messaging client during the init
+# phase so the first request does not pay for them; the rest stay lazy
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    get_table()
+    get_social()
+
 
 # =============================================================================
 # ENVIRONMENT CONFIGURATION
@@ -158,7 +175,7 @@ def get_business_name(meta_waba_id: str) -> str:
 # =============================================================================
 # VALIDATION HELPERS
 # =============================================================================
-def validate_required_fields(event: Dict[str, Any], fields: List[str]) -> Optional[Dict[str, Any]]:
+def validate_required_fields(event: Dict[str, Any], fields: Sequence[str]) -> Optional[Dict[str, Any]]:
     """Validate required fields in event. Returns error response if validation fails."""
     missing = [f for f in fields if not event.get(f)]
     if missing:
@@ -192,6 +209,18 @@ def store_item(item: Dict[str, Any]) -> bool:
         return False
 
 
+def store_items_batch(items: List[Dict[str, Any]]) -> bool:
+    """Store many items in DynamoDB using BatchWriteItem (25 per request)."""
+    try:
+        with get_table().batch_writer(overwrite_by_pkeys=[MESSAGES_PK_NAME]) as writer:
+            for item in items:
+                writer.put_item(Item=item)
+        return True
+    except ClientError as e:
+        logger.exception(f"Failed to batch store items: {e}")
+        return False
+
+
 def update_item(pk: str, updates: Dict[str, Any]) -> bool:
     """Update item in DynamoDB."""
     try:
@@ -217,16 +246,52 @@ def update_item(pk: str, updates: Dict[str, Any]) -> bool:
         return False
 
 
-def get_item(pk: str) -> Optional[Dict[str, Any]]:
-    """Get item from DynamoDB."""
+def get_item(pk: str, projection: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+    """Get item from DynamoDB, optionally fetching only the projected attributes."""
     try:
-        response = get_table().get_item(Key={MESSAGES_PK_NAME: pk})
+        kwargs = {"Key": {MESSAGES_PK_NAME: pk}}
+        if projection:
+            names = {f"#p{i}": attr for i, attr in enumerate(projection)}
+            kwargs["ProjectionExpression"] = ", ".join(names)
+            kwargs["ExpressionAttributeNames"] = names
+        response = get_table().get_item(**kwargs)
         return response.get("Item")
     except ClientError as e:
         logger.exception(f"Failed to get item: {e}")
         return None
 
 
+# UnprocessedKeys retry: capped exponential backoff with full jitter
+BATCH_GET_MAX_RETRIES = 8
+BATCH_GET_BACKOFF_BASE = 0.05
+BATCH_GET_BACKOFF_CAP = 2.0
+
+
+def get_items_batch(pks: List[str]) -> List[Dict[str, Any]]:
+    """Get many items by pk using BatchGetItem (100 keys per request), retrying unprocessed keys."""
+    table_name = get_table().name
+    pks = list(dict.fromkeys(pks))  # BatchGetItem rejects duplicate keys
+    items = []
+    try:
+        for start in range(0, len(pks), 100):
+            request = {table_name: {"Keys": [{MESSAGES_PK_NAME: pk} for pk in pks[start:start + 100]]}}
+            for attempt in range(BATCH_GET_MAX_RETRIES + 1):
+                if attempt:
+                    # Unprocessed keys mean throttling - back off before retrying
+                    time.sleep(random.uniform(0, min(BATCH_GET_BACKOFF_CAP, BATCH_GET_BACKOFF_BASE * 2 ** attempt)))
+                response = get_ddb().batch_get_item(RequestItems=request)
+                items.extend(response.get("Responses", {}).get(table_name, []))
+                request = response.get("UnprocessedKeys")
+                if not request:
+                    break
+            else:
+                logger.warning(f"batch_get_item: {len(request[table_name]['Keys'])} keys still unprocessed after retries")
+        return items
+    except ClientError as e:
+        logger.exception(f"Failed to batch get items: {e}")
+        return items
+
+
 def query_items(
     index_name: str = None,
     key_condition: str = None,
@@ -265,6 +330,35 @@ def query_items(
         return []
 
 
+def paginate_items(operation: str, max_items: int = None, **kwargs) -> List[Dict[str, Any]]:
+    """Run a table query/scan, following LastEvaluatedKey until exhausted or max_items collected."""
+    read = getattr(get_table(), operation)
+    items = []
+    while True:
+        response = read(**kwargs)
+        items.extend(response.get("Items", []))
+        if max_items and len(items) >= max_items:
+            return items[:max_items]
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            return items
+        kwargs["ExclusiveStartKey"] = last_key
+
+
+def paginate_count(operation: str, **kwargs) -> int:
+    """Sum Select=COUNT results of a table query/scan across all pages."""
+    read = getattr(get_table(), operation)
+    kwargs["Select"] = "COUNT"
+    total = 0
+    while True:
+        response = read(**kwargs)
+        total += response.get("Count", 0)
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            return total
+        kwargs["ExclusiveStartKey"] = last_key
+
+
 def delete_item(pk: str) -> bool:
     """Delete item from DynamoDB."""
     try:
@@ -321,6 +415,18 @@ def success_response(operation: str, data: Dict[str, Any] = None, **kwargs) -> D
     return response
 
 
+def client_error_guard(func: HandlerFunc) -> HandlerFunc:
+    """Decorator translating an uncaught AWS ClientError into a 500 response."""
+    @wraps(func)
+    def wrapper(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+        try:
+            return func(event, context)
+        except ClientError as e:
+            logger.exception(f"{func.__name__} failed: {e}")
+            return {"statusCode": 500, "error": str(e)}
+    return wrapper
+
+
 def error_response(message: str, status_code: int = 400) -> Dict[str, Any]:
     """Create a standardized error response."""
     return {"statusCode": status_code, "error": message}
@@ -351,7 +457,7 @@ def register_handler(action: str, category: str = "general", description: str =
         _HANDLERS[action] = func
         _HANDLER_METADATA[action] = {
             "category": category,
-            "description": description or (func.__doc__ or "No description").split("\n")[0].strip(),
+            "description": description or (func.__doc__ or "No description").split("\n", 1)[0].strip(),
             "module": func.__module__,
         }
         return func
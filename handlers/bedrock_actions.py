@@ -47,25 +47,39 @@ CONFIG = {
     },
 }
 
+# Voice settings resolved once for the hot voice path
+_REGION = CONFIG["region"]
+_VOICE_CFG = CONFIG["voice"]
+_VOICE_BUCKET = _VOICE_CFG["s3_bucket"]
+_DEFAULT_VOICE = _VOICE_CFG["polly_voice"]
+_POLLY_ENGINE = _VOICE_CFG["polly_engine"]
+_S3_URL_PREFIX = f"https://{_VOICE_BUCKET}/"
 
-def format_agent_response(action_group: str, function: str, response_body: Dict, api_path: str = "/") -> Dict:
-    """Format response for Bedrock Agent (OpenAPI format)."""
+
+def _wrap(action_group: str, status_code: int, body: str, api_path: str) -> Dict:
+    """Build a Bedrock Agent envelope around an already-serialized body."""
     return {
         "messageVersion": "1.0",
         "response": {
             "actionGroup": action_group,
             "apiPath": api_path,
             "httpMethod": "POST",
-            "httpStatusCode": response_body.get("statusCode", 200),
-            "responseBody": {
-                "application/json": {
-                    "body": json.dumps(response_body, default=str)
-                }
-            }
-        }
+            "httpStatusCode": status_code,
+            "responseBody": {"application/json": {"body": body}},
+        },
     }
 
 
+def format_agent_response(action_group: str, function: str, response_body: Dict, api_path: str = "/") -> Dict:
+    """Format response for Bedrock Agent (OpenAPI format)."""
+    return _wrap(
+        action_group,
+        response_body.get("statusCode", 200),
+        json.dumps(response_body, default=str),
+        api_path,
+    )
+
+
 def extract_params(event: Dict) -> Dict:
     """Extract parameters from Bedrock Agent event."""
     request_body = event.get("requestBody", {})
@@ -362,6 +376,12 @@ def handle_notifications_action(event: Dict[str, Any], context: Any) -> Dict[str
 # =============================================================================
 # VOICE API HANDLER (Polly TTS + SMS fallback)
 # =============================================================================
+_VOICE_SMS_PREFIX = "WECARE.DIGITAL: "
+
+# Messages longer than this (~30s of speech) use an async Polly synthesis task
+_ASYNC_SYNTHESIS_THRESHOLD = 1500
+
+
 def handle_voice_action(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Handle Voice API requests using Polly TTS.
     
@@ -369,7 +389,8 @@ def handle_voice_action(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     generates audio via Polly and sends SMS with audio link.
     DO NOT use sender_id unless explicitly provided.
     """
-    logger.info(f"Bedrock Agent Voice Request: {json.dumps(event, default=str)[:500]}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Bedrock Agent Voice Request: %s", json.dumps(event, default=str)[:500])
     
     import boto3
     import uuid
@@ -381,7 +402,7 @@ def handle_voice_action(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     try:
         to_number = params.get("to", "")
         message = params.get("message", "")
-        voice_id = params.get("voice_id", CONFIG["voice"]["polly_voice"])
+        voice_id = params.get("voice_id", _DEFAULT_VOICE)
         # Only use sender_id if explicitly provided
         sender_id = params.get("sender_id", "")
         
@@ -392,33 +413,57 @@ def handle_voice_action(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         if not to_number.startswith("+"):
             to_number = f"+{to_number}"
         
-        polly = boto3.client("polly", region_name=CONFIG["region"])
-        s3 = boto3.client("s3", region_name=CONFIG["region"])
+        polly = boto3.client("polly", region_name=_REGION)
         
-        # Generate TTS audio with Polly
-        polly_response = polly.synthesize_speech(
-            Text=message,
-            OutputFormat="mp3",
-            VoiceId=voice_id,
-            Engine=CONFIG["voice"]["polly_engine"]
-        )
+        # Hex prefix fans writes out across S3 partitions
+        audio_id = uuid.uuid4().hex
+        audio_prefix = f"voice/{audio_id[:2]}/"
+        synthesis_task = None
         
-        # Save to S3
-        audio_key = f"voice/{uuid.uuid4()}.mp3"
-        s3.put_object(
-            Bucket=CONFIG["voice"]["s3_bucket"],
-            Key=audio_key,
-            Body=polly_response["AudioStream"].read(),
-            ContentType="audio/mpeg"
-        )
+        if len(message) > _ASYNC_SYNTHESIS_THRESHOLD:
+            # Long messages: Polly writes the audio straight to S3 so the
+            # stream never passes through Lambda. Output key is <prefix><TaskId>.mp3
+            task = polly.start_speech_synthesis_task(
+                Text=message,
+                OutputFormat="mp3",
+                VoiceId=voice_id,
+                Engine=_POLLY_ENGINE,
+                OutputS3BucketName=_VOICE_BUCKET,
+                OutputS3KeyPrefix=audio_prefix
+            )["SynthesisTask"]
+            audio_key = f"{audio_prefix}{task['TaskId']}.mp3"
+            synthesis_task = {"taskId": task["TaskId"], "status": task.get("TaskStatus", "scheduled")}
+        else:
+            # Generate TTS audio with Polly
+            polly_response = polly.synthesize_speech(
+                Text=message,
+                OutputFormat="mp3",
+                VoiceId=voice_id,
+                Engine=_POLLY_ENGINE
+            )
+            
+            # Save to S3
+            audio_key = f"{audio_prefix}{audio_id}.mp3"
+            s3 = boto3.client("s3", region_name=_REGION)
+            s3.put_object(
+                Bucket=_VOICE_BUCKET,
+                Key=audio_key,
+                Body=polly_response["AudioStream"].read(),
+                ContentType="audio/mpeg"
+            )
         
-        audio_url = f"https://{CONFIG['voice']['s3_bucket']}/{audio_key}"
+        # An async task's MP3 does not exist yet, so no link is handed out for it -
+        # the caller gets the task id and the eventual key instead
+        audio_url = None if synthesis_task else _S3_URL_PREFIX + audio_key
+        if synthesis_task:
+            synthesis_task["audioKey"] = audio_key
         
         # For India numbers, send SMS with audio link
         if to_number.startswith("+91"):
-            sms_voice = boto3.client("pinpoint-sms-voice-v2", region_name=CONFIG["region"])
+            sms_voice = boto3.client("pinpoint-sms-voice-v2", region_name=_REGION)
             
-            sms_text = f"WECARE.DIGITAL: {message[:140]}"  # Keep under 160 chars
+            # Keep under 160 chars
+            sms_text = _VOICE_SMS_PREFIX + (message if len(message) <= 140 else message[:140])
             
             # Build SMS params - AWS auto-routing (no DLT for voice fallback)
             sms_params = {
@@ -433,21 +478,32 @@ def handle_voice_action(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             response_body = {
                 "statusCode": 200,
                 "messageId": sms_response.get("MessageId", ""),
-                "audioUrl": audio_url,
                 "provider": "AWS_POLLY_SMS",
                 "destination": to_number,
                 "status": "sent_as_sms",
                 "message": f"Voice message generated and SMS sent to {to_number}"
             }
-        else:
+        elif audio_url:
             response_body = {
                 "statusCode": 200,
-                "audioUrl": audio_url,
                 "provider": "AWS_POLLY",
                 "destination": to_number,
                 "status": "audio_generated",
                 "message": f"Voice audio generated: {audio_url}"
             }
+        else:
+            response_body = {
+                "statusCode": 202,
+                "provider": "AWS_POLLY",
+                "destination": to_number,
+                "status": "audio_pending",
+                "message": f"Voice audio synthesis started (task {synthesis_task['taskId']})"
+            }
+        
+        if audio_url:
+            response_body["audioUrl"] = audio_url
+        if synthesis_task:
+            response_body["synthesisTask"] = synthesis_task
         
         return format_agent_response(action_group, "makeVoiceCall", response_body, api_path)
     
@@ -457,6 +513,28 @@ def handle_voice_action(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             {"statusCode": 500, "error": str(e)}, api_path)
 
 
+# =============================================================================
+# ACTION GROUP ROUTING
+# =============================================================================
+_HANDLERS = {
+    "PaymentsAPI": handle_payments_action,
+    "ShortlinksAPI": handle_shortlinks_action,
+    "WhatsAppAPI": handle_whatsapp_action,
+    "NotificationsAPI": handle_notifications_action,
+    "VoiceAPI": handle_voice_action,
+}
+
+
+def _unknown_action_response(action_group: str, api_path: str) -> Dict:
+    """Build the 400 response for an unrecognised action group."""
+    return _wrap(
+        action_group,
+        400,
+        json.dumps({"error": f"Unknown action group: {action_group}"}, default=str),
+        api_path or "/",
+    )
+
+
 # =============================================================================
 # LAMBDA HANDLER - MAIN ENTRY POINT
 # =============================================================================
@@ -470,7 +548,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     - NotificationsAPI: SMS (EUM) + Email (SES)
     - VoiceAPI: Polly TTS + SMS fallback
     """
-    logger.info(f"Bedrock Agent Event: {json.dumps(event, default=str)[:1000]}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Bedrock Agent Event: %s", json.dumps(event, default=str)[:1000])
     
     action_group = event.get("actionGroup", "")
     api_path = event.get("apiPath", "")
@@ -482,36 +561,13 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         app_json = content.get("application/json", {})
         properties = app_json.get("properties", [])
         
-        params = []
-        for prop in properties:
-            params.append({"name": prop.get("name", ""), "value": prop.get("value", "")})
-        
-        event["parameters"] = params
+        event["parameters"] = [
+            {"name": p.get("name", ""), "value": p.get("value", "")} for p in properties
+        ]
         event["function"] = api_path.replace("/", "") or "default"
     
     # Route to appropriate handler
-    if action_group == "PaymentsAPI":
-        return handle_payments_action(event, context)
-    elif action_group == "ShortlinksAPI":
-        return handle_shortlinks_action(event, context)
-    elif action_group == "WhatsAppAPI":
-        return handle_whatsapp_action(event, context)
-    elif action_group == "NotificationsAPI":
-        return handle_notifications_action(event, context)
-    elif action_group == "VoiceAPI":
-        return handle_voice_action(event, context)
-    else:
-        return {
-            "messageVersion": "1.0",
-            "response": {
-                "actionGroup": action_group,
-                "apiPath": api_path or "/",
-                "httpMethod": "POST",
-                "httpStatusCode": 400,
-                "responseBody": {
-                    "application/json": {
-                        "body": json.dumps({"error": f"Unknown action group: {action_group}"})
-                    }
-                }
-            }
-        }
+    handler = _HANDLERS.get(action_group)
+    if handler:
+        return handler(event, context)
+    return _unknown_action_response(action_group, api_path)
@@ -18,8 +18,8 @@
 
 import json
 import logging
-from typing import Any, Dict, Optional
-from enum import Enum
+from typing import Any, Dict, Optional, Tuple
+from dataclasses import dataclass
 from handlers.base import (
     table, social, s3, MESSAGES_PK_NAME, MEDIA_BUCKET, MEDIA_PREFIX,
     iso_now, get_phone_arn, get_waba_config, validate_required_fields,
@@ -34,19 +34,18 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 # CAPABILITY FLAGS (Upgrade Hooks)
 # =============================================================================
-class Capability(Enum):
+@dataclass(frozen=True, slots=True)
+class _Caps:
     """Feature capability flags for upgrade-friendly design."""
     # Business Profile remote update via AWS EUM API
     # Set to True when AWS adds this capability
-    BUSINESS_PROFILE_REMOTE_UPDATE = False
+    business_profile_remote_update: bool = False
     
     # Business Profile avatar upload via AWS EUM API
-    BUSINESS_PROFILE_AVATAR_UPLOAD = True  # Supported via post_whatsapp_message_media
+    business_profile_avatar_upload: bool = True  # Supported via post_whatsapp_message_media
 
 
-def is_capability_enabled(capability: Capability) -> bool:
-    """Check if a capability is enabled."""
-    return capability.value
+CAPS = _Caps()
 
 
 # =============================================================================
@@ -66,13 +65,14 @@ class AwsEumProvider:
         
         STUB: Not currently supported by AWS EUM Social.
         When AWS adds this capability:
-        1. Set Capability.BUSINESS_PROFILE_REMOTE_UPDATE = True
+        1. Change the business_profile_remote_update field default in _Caps to True
+           (_Caps is frozen; CAPS cannot be modified at runtime)
         2. Implement the actual API call here
         
         Returns:
             Dict with success=False and NotSupported error
         """
-        if not is_capability_enabled(Capability.BUSINESS_PROFILE_REMOTE_UPDATE):
+        if not CAPS.business_profile_remote_update:
             return {
                 "success": False,
                 "error": "NotSupported",
@@ -96,7 +96,7 @@ class AwsEumProvider:
         
         STUB: Not currently supported by AWS EUM Social.
         """
-        if not is_capability_enabled(Capability.BUSINESS_PROFILE_REMOTE_UPDATE):
+        if not CAPS.business_profile_remote_update:
             return {
                 "success": False,
                 "error": "NotSupported",
@@ -119,6 +119,24 @@ def _build_profile_pk_by_waba(meta_waba_id: str) -> str:
     return f"PROFILE#{meta_waba_id}"
 
 
+def _require_waba(event: Dict[str, Any], required: bool = True) -> Tuple[str, str, Optional[Dict[str, Any]]]:
+    """Resolve metaWabaId and its phone ARN from the event.
+    
+    Returns (meta_waba_id, phone_arn, error_response_or_None). When
+    required is False a missing metaWabaId is not an error.
+    """
+    meta_waba_id = event.get("metaWabaId", "")
+    if not meta_waba_id:
+        if required:
+            return "", "", error_response("Missing required fields: metaWabaId", 400)
+        return "", "", None
+    
+    phone_arn = get_phone_arn(meta_waba_id)
+    if not phone_arn:
+        return meta_waba_id, "", error_response(f"Phone not found for WABA: {meta_waba_id}", 404)
+    return meta_waba_id, phone_arn, None
+
+
 # =============================================================================
 # GET BUSINESS PROFILE
 # =============================================================================
@@ -153,31 +171,17 @@ def handle_get_business_profile(event: Dict[str, Any], context: Any) -> Dict[str
     else:
         return error_response("metaWabaId or (tenantId + phoneNumberId) is required", 400)
     
-    phone_arn = ""
-    if meta_waba_id:
-        phone_arn = get_phone_arn(meta_waba_id)
-        if not phone_arn:
-            return error_response(f"Phone not found for WABA: {meta_waba_id}", 404)
-    
-    # Check cache first
-    try:
-        cached = get_item(profile_pk)
-        if cached:
-            return success_response(
-                "get_business_profile",
-                profile=cached,
-                cached=True,
-                remoteUpdateSupported=is_capability_enabled(Capability.BUSINESS_PROFILE_REMOTE_UPDATE)
-            )
-    except ClientError:
-        pass
+    meta_waba_id, phone_arn, err = _require_waba(event, required=False)
+    if err:
+        return err
     
-    # Create default profile from WABA config
+    # Read-or-create in one round trip: if_not_exists() only fills attributes
+    # that are missing, so an existing profile comes back unchanged.
     try:
+        now = iso_now()
         waba_config = get_waba_config(meta_waba_id) if meta_waba_id else {}
         
-        profile_data = {
-            MESSAGES_PK_NAME: profile_pk,
+        defaults = {
             "itemType": "BUSINESS_PROFILE",
             "wabaMetaId": meta_waba_id,
             "tenantId": tenant_id or meta_waba_id,
@@ -185,8 +189,8 @@ def handle_get_business_profile(event: Dict[str, Any], context: Any) -> Dict[str
             "businessName": waba_config.get("businessAccountName", ""),
             "phone": waba_config.get("phone", ""),
             "phoneArn": phone_arn,
-            "createdAt": iso_now(),
-            "lastUpdatedAt": iso_now(),
+            "createdAt": now,
+            "lastUpdatedAt": now,
             # Profile fields (CRM-local)
             "about": "",
             "address": "",
@@ -200,13 +204,24 @@ def handle_get_business_profile(event: Dict[str, Any], context: Any) -> Dict[str
             "lastSyncedToWhatsApp": None,
         }
         
-        store_item(profile_data)
+        names = {f"#a{i}": k for i, k in enumerate(defaults)}
+        values = {f":a{i}": v for i, v in enumerate(defaults.values())}
+        response = table().update_item(
+            Key={MESSAGES_PK_NAME: profile_pk},
+            UpdateExpression="SET " + ", ".join(
+                f"#a{i} = if_not_exists(#a{i}, :a{i})" for i in range(len(defaults))
+            ),
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values,
+            ReturnValues="ALL_NEW",
+        )
+        profile = response.get("Attributes", {})
         
         return success_response(
             "get_business_profile",
-            profile=profile_data,
-            cached=False,
-            remoteUpdateSupported=is_capability_enabled(Capability.BUSINESS_PROFILE_REMOTE_UPDATE)
+            profile=profile,
+            cached=profile.get("createdAt") != now,
+            remoteUpdateSupported=CAPS.business_profile_remote_update
         )
     except ClientError as e:
         return error_response(str(e), 500)
@@ -215,6 +230,10 @@ def handle_get_business_profile(event: Dict[str, Any], context: Any) -> Dict[str
 # =============================================================================
 # UPDATE BUSINESS PROFILE (CRM-Local)
 # =============================================================================
+# Editable CRM-local profile attributes
+_PROFILE_FIELDS = ("about", "address", "description", "email", "websites", "vertical")
+
+
 def handle_update_business_profile(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Update business profile in CRM-local storage.
     
@@ -260,11 +279,9 @@ def handle_update_business_profile(event: Dict[str, Any], context: Any) -> Dict[
     else:
         return error_response("metaWabaId or (tenantId + phoneNumberId) is required", 400)
     
-    phone_arn = ""
-    if meta_waba_id:
-        phone_arn = get_phone_arn(meta_waba_id)
-        if not phone_arn:
-            return error_response(f"Phone not found for WABA: {meta_waba_id}", 404)
+    meta_waba_id, phone_arn, err = _require_waba(event, required=False)
+    if err:
+        return err
     
     now = iso_now()
     
@@ -278,29 +295,17 @@ def handle_update_business_profile(event: Dict[str, Any], context: Any) -> Dict[
             )
             profile_picture_handle = upload_resp.get("mediaId", "")
         
-        # Build update expression
-        update_parts = ["lastUpdatedAt = :now"]
-        expr_values = {":now": now}
-        expr_names = {}
-        
-        # Add profile fields
-        profile_fields = ["about", "address", "description", "email", "websites", "vertical"]
-        for field in profile_fields:
-            if field in data:
-                update_parts.append(f"#{field} = :{field}")
-                expr_names[f"#{field}"] = field
-                expr_values[f":{field}"] = data[field]
+        # Build update expression (always marks the profile as pending sync)
+        present = [f for f in _PROFILE_FIELDS if f in data]
+        update_parts = ["lastUpdatedAt = :now", "syncStatus = :ss"] + [f"#{f} = :{f}" for f in present]
+        expr_values = {":now": now, ":ss": "pending_sync", **{f":{f}": data[f] for f in present}}
+        expr_names = {f"#{f}": f for f in present}
         
         if profile_picture_handle:
-            update_parts.append("profilePictureHandle = :pph")
-            update_parts.append("profilePictureS3Key = :pps")
+            update_parts += ["profilePictureHandle = :pph", "profilePictureS3Key = :pps"]
             expr_values[":pph"] = profile_picture_handle
             expr_values[":pps"] = profile_picture_s3_key
         
-        # Mark as pending sync
-        update_parts.append("syncStatus = :ss")
-        expr_values[":ss"] = "pending_sync"
-        
         # Update DynamoDB
         table().update_item(
             Key={MESSAGES_PK_NAME: profile_pk},
@@ -348,16 +353,15 @@ def handle_upload_profile_picture(event: Dict[str, Any], context: Any) -> Dict[s
         "s3Key": "WhatsApp/profiles/avatar.jpg"
     }
     """
-    meta_waba_id = event.get("metaWabaId", "")
     s3_key = event.get("s3Key", "")
     
     err = validate_required_fields(event, ["metaWabaId", "s3Key"])
     if err:
         return err
     
-    phone_arn = get_phone_arn(meta_waba_id)
-    if not phone_arn:
-        return error_response(f"Phone not found for WABA: {meta_waba_id}", 404)
+    meta_waba_id, phone_arn, err = _require_waba(event)
+    if err:
+        return err
     
     try:
         # Upload to WhatsApp
@@ -443,6 +447,53 @@ def handle_mark_business_profile_applied(event: Dict[str, Any], context: Any) ->
         return error_response(str(e), 500)
 
 
+# Static Meta Business Manager runbook; steps 3, 6 and 7 are filled per request
+_APPLY_INSTRUCTIONS_TEMPLATE = (
+    {
+        "step": 1,
+        "action": "Open Meta Business Manager",
+        "url": "https://business.facebook.com/",
+        "details": "Log in with your business account credentials"
+    },
+    {
+        "step": 2,
+        "action": "Navigate to WhatsApp Manager",
+        "details": "Go to All Tools > WhatsApp Manager"
+    },
+    {
+        "step": 3,
+        "action": "Select your WhatsApp Business Account",
+        "details": ""
+    },
+    {
+        "step": 4,
+        "action": "Go to Phone Numbers",
+        "details": "Click on 'Phone numbers' in the left sidebar"
+    },
+    {
+        "step": 5,
+        "action": "Edit Business Profile",
+        "details": "Click on your phone number, then 'Edit' next to Business Profile"
+    },
+    {
+        "step": 6,
+        "action": "Update Profile Fields",
+        "details": "Update the following fields with your CRM data:",
+        "fields": {}
+    },
+    {
+        "step": 7,
+        "action": "Upload Profile Picture (if changed)",
+        "details": ""
+    },
+    {
+        "step": 8,
+        "action": "Save Changes",
+        "details": "Click 'Save' to apply the changes"
+    },
+)
+
+
 def handle_get_business_profile_apply_instructions(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Get instructions for applying business profile changes to WhatsApp.
     
@@ -457,6 +508,7 @@ def handle_get_business_profile_apply_instructions(event: Dict[str, Any], contex
     """
     meta_waba_id = event.get("metaWabaId", "")
     
+    # Only reads the stored profile - no phone ARN needed
     err = validate_required_fields(event, ["metaWabaId"])
     if err:
         return err
@@ -468,62 +520,24 @@ def handle_get_business_profile_apply_instructions(event: Dict[str, Any], contex
     if not profile:
         return error_response(f"Profile not found for WABA: {meta_waba_id}", 404)
     
-    # Build instructions
+    # Build instructions from the static runbook, patching per-WABA steps
+    steps = [dict(step) for step in _APPLY_INSTRUCTIONS_TEMPLATE]
+    steps[2]["details"] = f"Select the account with WABA ID: {meta_waba_id}"
+    steps[5]["fields"] = {
+        "About": profile.get("about", ""),
+        "Address": profile.get("address", ""),
+        "Description": profile.get("description", ""),
+        "Email": profile.get("email", ""),
+        "Websites": profile.get("websites", []),
+        "Category": profile.get("vertical", "")
+    }
+    steps[6]["details"] = f"Upload the image from S3: {profile.get('profilePictureS3Key', 'N/A')}"
+    
     instructions = {
         "title": "Apply Business Profile to WhatsApp",
         "description": "Follow these steps to update your WhatsApp Business Profile in Meta Business Manager",
-        "remoteUpdateSupported": is_capability_enabled(Capability.BUSINESS_PROFILE_REMOTE_UPDATE),
-        "steps": [
-            {
-                "step": 1,
-                "action": "Open Meta Business Manager",
-                "url": "https://business.facebook.com/",
-                "details": "Log in with your business account credentials"
-            },
-            {
-                "step": 2,
-                "action": "Navigate to WhatsApp Manager",
-                "details": "Go to All Tools > WhatsApp Manager"
-            },
-            {
-                "step": 3,
-                "action": "Select your WhatsApp Business Account",
-                "details": f"Select the account with WABA ID: {meta_waba_id}"
-            },
-            {
-                "step": 4,
-                "action": "Go to Phone Numbers",
-                "details": "Click on 'Phone numbers' in the left sidebar"
-            },
-            {
-                "step": 5,
-                "action": "Edit Business Profile",
-                "details": "Click on your phone number, then 'Edit' next to Business Profile"
-            },
-            {
-                "step": 6,
-                "action": "Update Profile Fields",
-                "details": "Update the following fields with your CRM data:",
-                "fields": {
-                    "About": profile.get("about", ""),
-                    "Address": profile.get("address", ""),
-                    "Description": profile.get("description", ""),
-                    "Email": profile.get("email", ""),
-                    "Websites": profile.get("websites", []),
-                    "Category": profile.get("vertical", "")
-                }
-            },
-            {
-                "step": 7,
-                "action": "Upload Profile Picture (if changed)",
-                "details": f"Upload the image from S3: {profile.get('profilePictureS3Key', 'N/A')}"
-            },
-            {
-                "step": 8,
-                "action": "Save Changes",
-                "details": "Click 'Save' to apply the changes"
-            }
-        ],
+        "remoteUpdateSupported": CAPS.business_profile_remote_update,
+        "steps": steps,
         "currentProfile": profile,
         "syncStatus": profile.get("syncStatus", "unknown"),
         "lastSyncedToWhatsApp": profile.get("lastSyncedToWhatsApp"),
@@ -1,12 +1,13 @@
 # WhatsApp Calling Handlers
 # Ref: https://developers.facebook.com/docs/whatsapp/cloud-api/phone-numbers/calling
 
-import json
 import logging
+import uuid
+from types import MappingProxyType
 from typing import Any, Dict
 from handlers.base import (
-    table, MESSAGES_PK_NAME, iso_now, store_item, get_item,
-    validate_required_fields, get_phone_arn, get_waba_config
+    client_error_guard, table, MESSAGES_PK_NAME, iso_now, store_item, get_item,
+    validate_required_fields, get_phone_arn, paginate_items, paginate_count
 )
 from botocore.exceptions import ClientError
 
@@ -22,7 +23,65 @@ CALL_TYPES = {
 # Call Status
 CALL_STATUSES = ["initiated", "ringing", "connected", "ended", "failed", "missed"]
 
+# GSI over call records: PK wabaMetaId, SK initiatedAt (sparse - only CALL items carry initiatedAt)
+CALLS_GSI = "gsi_waba_calls"
 
+# Attributes fetched by get_call_logs in items/stats mode (#st/#du alias reserved words)
+CALL_LOG_PROJECTION = "callId, #st, #du, initiatedAt, toNumber"
+
+# Defaults for WABAs that have never stored call settings
+_DEFAULT_CALL_SETTINGS = MappingProxyType({
+    "callingEnabled": True,
+    "businessInitiatedEnabled": True,
+    "userInitiatedEnabled": True,
+    "sipEnabled": False,
+    "maxConcurrentCalls": 10,
+    "callRecordingEnabled": False,
+    "autoAnswerEnabled": False,
+})
+
+# Attributes returned by get_call_settings
+CALL_SETTINGS_FIELDS = [*_DEFAULT_CALL_SETTINGS, "lastUpdatedAt"]
+
+# Deep link helpers
+_PHONE_STRIP = str.maketrans("", "", "+ -")
+_DEEPLINK_TEMPLATES = {
+    "voice": "https://wa.me/{}?call=voice",
+    "video": "https://wa.me/{}?call=video",
+    "universal": "whatsapp://call?phone={}",
+}
+
+
+def _call_stats_pk(meta_waba_id: str) -> str:
+    """Build DynamoDB PK for the per-WABA call counter item.
+    
+    The counters only see calls made after they were introduced; run the
+    backfill_call_stats action once to seed them from existing call records.
+    """
+    return f"CALL_STATS#{meta_waba_id}"
+
+
+def _add_call_stats(meta_waba_id: str, **counters: int) -> None:
+    """Atomically ADD to the per-WABA call counters (best effort)."""
+    if not meta_waba_id or not counters:
+        return
+    try:
+        table().update_item(
+            Key={MESSAGES_PK_NAME: _call_stats_pk(meta_waba_id)},
+            UpdateExpression="SET itemType = :it, wabaMetaId = :waba, lastUpdatedAt = :now ADD "
+                + ", ".join(f"{k} :{k}" for k in counters),
+            ExpressionAttributeValues={
+                ":it": "CALL_STATS",
+                ":waba": meta_waba_id,
+                ":now": iso_now(),
+                **{f":{k}": v for k, v in counters.items()},
+            },
+        )
+    except ClientError as e:
+        logger.warning(f"Failed to update call stats for {meta_waba_id}: {e}")
+
+
+@client_error_guard
 def handle_initiate_call(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Initiate a WhatsApp call (business-initiated).
     
@@ -54,52 +113,56 @@ def handle_initiate_call(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         return {"statusCode": 404, "error": f"Phone not found for WABA: {meta_waba_id}"}
     
     now = iso_now()
-    call_id = f"CALL_{now.replace(':', '').replace('-', '').replace('.', '')}"
+    # Random ID: timestamp-derived IDs collide under concurrent initiations
+    call_id = f"CALL_{uuid.uuid4().hex}"
     call_pk = f"CALL#{call_id}"
     
-    try:
-        # Store call record
-        call_data = {
-            MESSAGES_PK_NAME: call_pk,
-            "itemType": "CALL",
-            "callId": call_id,
-            "wabaMetaId": meta_waba_id,
-            "phoneArn": phone_arn,
-            "toNumber": to_number,
-            "callType": call_type,
-            "agentId": agent_id,
-            "callReason": call_reason,
-            "status": "initiated",
-            "initiatedAt": now,
-            "statusHistory": [{"status": "initiated", "timestamp": now}],
-        }
-        
-        store_item(call_data)
-        
-        # Note: Actual call initiation requires WhatsApp Business API call endpoint
-        # This stores the call intent and tracking data
-        
-        return {
-            "statusCode": 200,
-            "operation": "initiate_call",
-            "callId": call_id,
-            "callPk": call_pk,
-            "to": to_number,
-            "callType": call_type,
-            "status": "initiated",
-            "message": "Call initiated. Actual call requires WhatsApp Business API calling endpoint."
-        }
-    except ClientError as e:
-        return {"statusCode": 500, "error": str(e)}
+    # Store call record
+    call_data = {
+        MESSAGES_PK_NAME: call_pk,
+        "itemType": "CALL",
+        "callId": call_id,
+        "wabaMetaId": meta_waba_id,
+        "phoneArn": phone_arn,
+        "toNumber": to_number,
+        "callType": call_type,
+        "agentId": agent_id,
+        "callReason": call_reason,
+        "status": "initiated",
+        "initiatedAt": now,
+        "statusHistory": [{"status": "initiated", "timestamp": now}],
+    }
+    
+    table().put_item(
+        Item=call_data,
+        ConditionExpression="attribute_not_exists(#pk)",
+        ExpressionAttributeNames={"#pk": MESSAGES_PK_NAME},
+    )
+    _add_call_stats(meta_waba_id, totalCalls=1)
+    
+    # Note: Actual call initiation requires WhatsApp Business API call endpoint
+    # This stores the call intent and tracking data
+    
+    return {
+        "statusCode": 200,
+        "operation": "initiate_call",
+        "callId": call_id,
+        "callPk": call_pk,
+        "to": to_number,
+        "callType": call_type,
+        "status": "initiated",
+        "message": "Call initiated. Actual call requires WhatsApp Business API calling endpoint."
+    }
 
 
+@client_error_guard
 def handle_update_call_status(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Update call status (from webhook or manual).
     
     Test Event:
     {
         "action": "update_call_status",
-        "callId": "CALL_20241230120000",
+        "callId": "CALL_3f2b9c0e8d7a4b6c9e1f2a3b4c5d6e7f",
         "status": "connected",
         "duration": 120
     }
@@ -119,53 +182,67 @@ def handle_update_call_status(event: Dict[str, Any], context: Any) -> Dict[str,
     call_pk = f"CALL#{call_id}"
     now = iso_now()
     
+    # Single atomic write: append to statusHistory server-side and fail if the call is unknown
+    update_parts = [
+        "#s = :s",
+        "lastUpdatedAt = :t",
+        "statusHistory = list_append(if_not_exists(statusHistory, :e), :h)",
+    ]
+    expr_values = {
+        ":s": status,
+        ":t": now,
+        ":e": [],
+        ":h": [{"status": status, "timestamp": now}],
+    }
+    expr_names = {"#s": "status", "#pk": MESSAGES_PK_NAME}
+    
+    if duration:
+        update_parts.append("#d = :d")
+        expr_values[":d"] = duration
+        expr_names["#d"] = "duration"
+    if end_reason:
+        update_parts.append("endReason = :er")
+        expr_values[":er"] = end_reason
+    if status == "ended":
+        update_parts.append("endedAt = :t")
+    
     try:
-        # Get existing call
-        existing = get_item(call_pk)
-        if not existing:
-            return {"statusCode": 404, "error": f"Call not found: {call_id}"}
-        
-        # Update status history
-        status_history = existing.get("statusHistory", [])
-        status_history.append({"status": status, "timestamp": now})
-        
-        update_data = {
-            "status": status,
-            "lastUpdatedAt": now,
-            "statusHistory": status_history,
-        }
-        
-        if duration:
-            update_data["duration"] = duration
-        if end_reason:
-            update_data["endReason"] = end_reason
-        if status == "ended":
-            update_data["endedAt"] = now
-        
-        # Update in DynamoDB
-        update_expr_parts = []
-        expr_values = {}
-        for key, value in update_data.items():
-            update_expr_parts.append(f"{key} = :{key}")
-            expr_values[f":{key}"] = value
-        
-        table().update_item(
+        response = table().update_item(
             Key={MESSAGES_PK_NAME: call_pk},
-            UpdateExpression="SET " + ", ".join(update_expr_parts),
+            UpdateExpression="SET " + ", ".join(update_parts),
+            ConditionExpression="attribute_exists(#pk)",
+            ExpressionAttributeNames=expr_names,
             ExpressionAttributeValues=expr_values,
+            ReturnValues="ALL_OLD",
         )
-        
-        return {
-            "statusCode": 200,
-            "operation": "update_call_status",
-            "callId": call_id,
-            "status": status,
-            "duration": duration
-        }
     except ClientError as e:
-        return {"statusCode": 500, "error": str(e)}
+        if e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+            return {"statusCode": 404, "error": f"Call not found: {call_id}"}
+        raise
+    existing = response.get("Attributes", {})
+    
+    # Roll the call into the WABA counters on the first transition to ended; the
+    # duration may have been reported by an earlier update
+    # Connected means ended with a non-zero duration, matching get_call_logs stats
+    if status == "ended" and existing.get("status") != "ended":
+        call_duration = duration or existing.get("duration", 0)
+        if call_duration > 0:
+            _add_call_stats(
+                existing.get("wabaMetaId", ""),
+                connectedCalls=1,
+                totalDurationSeconds=call_duration,
+            )
+    
+    return {
+        "statusCode": 200,
+        "operation": "update_call_status",
+        "callId": call_id,
+        "status": status,
+        "duration": duration
+    }
 
 
+@client_error_guard
 def handle_get_call_logs(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Get call logs.
     
@@ -177,66 +254,208 @@ def handle_get_call_logs(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         "status": "ended",
         "limit": 50
     }
+    
+    Stats only (reads the running CALL_STATS counters, no item fetch):
+    {
+        "action": "get_call_logs",
+        "metaWabaId": "1347766229904230",
+        "statsOnly": true
+    }
+    
+    Optional mode: "count" (Select=COUNT summed over all pages, no items,
+    limit ignored), "items" (projected call fields + stats) or "stats"
+    (stats from projected fields, no calls).
+    Omit for full call records plus stats.
     """
     meta_waba_id = event.get("metaWabaId", "")
     agent_id = event.get("agentId", "")
     status = event.get("status", "")
     to_number = event.get("toNumber", "")
     limit = event.get("limit", 50)
+    stats_only = event.get("statsOnly", False)
+    mode = event.get("mode", "")
     
-    try:
-        filter_expr = "itemType = :it"
-        expr_values = {":it": "CALL"}
-        
+    if stats_only:
+        if not meta_waba_id:
+            return {"statusCode": 400, "error": "metaWabaId is required for statsOnly"}
+        # The counters are kept per WABA only - filtered stats need a full read
+        if agent_id or status or to_number:
+            return {
+                "statusCode": 400,
+                "error": "statsOnly returns WABA-wide counters; agentId/status/toNumber filters are not supported"
+            }
+        counters = get_item(_call_stats_pk(meta_waba_id)) or {}
+        total_duration = counters.get("totalDurationSeconds", 0)
+        connected_calls = counters.get("connectedCalls", 0)
+        return {
+            "statusCode": 200,
+            "operation": "get_call_logs",
+            "statsScope": "waba",
+            "stats": {
+                "totalCalls": counters.get("totalCalls", 0),
+                "connectedCalls": connected_calls,
+                "totalDurationSeconds": total_duration,
+                "avgDurationSeconds": round(total_duration / connected_calls, 2) if connected_calls > 0 else 0
+            }
+        }
+    
+    filter_parts = ["itemType = :it"]
+    expr_values = {":it": "CALL"}
+    expr_names = {}
+    
+    if agent_id:
+        filter_parts.append("agentId = :aid")
+        expr_values[":aid"] = agent_id
+    
+    if status:
+        filter_parts.append("#st = :st")
+        expr_values[":st"] = status
+        expr_names["#st"] = "status"
+    
+    if to_number:
+        filter_parts.append("toNumber = :tn")
+        expr_values[":tn"] = to_number
+    
+    # count mode sums Select=COUNT over every page, so it takes no Limit
+    read_kwargs = {} if mode == "count" else {"Limit": limit}
+    if mode in ("items", "stats"):
+        read_kwargs["ProjectionExpression"] = CALL_LOG_PROJECTION
+        expr_names.update({"#st": "status", "#du": "duration"})
+    
+    response = None
+    if meta_waba_id:
+        # WABA-scoped reads go through the call GSI; remaining filters are residual
+        query_kwargs = {
+            **read_kwargs,
+            "IndexName": CALLS_GSI,
+            "KeyConditionExpression": "wabaMetaId = :waba",
+            "FilterExpression": " AND ".join(filter_parts),
+            "ExpressionAttributeValues": {**expr_values, ":waba": meta_waba_id},
+            "ScanIndexForward": False,
+        }
+        if expr_names:
+            query_kwargs["ExpressionAttributeNames"] = expr_names
+        try:
+            if mode == "count":
+                response = {"Count": paginate_count("query", **query_kwargs)}
+            else:
+                response = table().query(**query_kwargs)
+        except ClientError as e:
+            # If GSI doesn't exist, fall back to scan
+            if "ValidationException" not in str(e):
+                raise
+            logger.warning(f"{CALLS_GSI} unavailable, falling back to scan")
+    
+    if response is None:
         if meta_waba_id:
-            filter_expr += " AND wabaMetaId = :waba"
+            filter_parts.append("wabaMetaId = :waba")
             expr_values[":waba"] = meta_waba_id
         
-        if agent_id:
-            filter_expr += " AND agentId = :aid"
-            expr_values[":aid"] = agent_id
-        
-        if status:
-            filter_expr += " AND #st = :st"
-            expr_values[":st"] = status
-        
-        if to_number:
-            filter_expr += " AND toNumber = :tn"
-            expr_values[":tn"] = to_number
-        
         scan_kwargs = {
-            "FilterExpression": filter_expr,
+            **read_kwargs,
+            "FilterExpression": " AND ".join(filter_parts),
             "ExpressionAttributeValues": expr_values,
-            "Limit": limit
         }
+        if expr_names:
+            scan_kwargs["ExpressionAttributeNames"] = expr_names
         
-        if status:
-            scan_kwargs["ExpressionAttributeNames"] = {"#st": "status"}
-        
-        response = table().scan(**scan_kwargs)
-        items = response.get("Items", [])
-        
-        # Calculate stats
-        total_calls = len(items)
-        total_duration = sum(i.get("duration", 0) for i in items)
-        connected_calls = len([i for i in items if i.get("status") == "ended" and i.get("duration", 0) > 0])
-        
+        if mode == "count":
+            response = {"Count": paginate_count("scan", **scan_kwargs)}
+        else:
+            response = table().scan(**scan_kwargs)
+    
+    if mode == "count":
         return {
             "statusCode": 200,
             "operation": "get_call_logs",
-            "count": total_calls,
-            "stats": {
-                "totalCalls": total_calls,
-                "connectedCalls": connected_calls,
-                "totalDurationSeconds": total_duration,
-                "avgDurationSeconds": round(total_duration / connected_calls, 2) if connected_calls > 0 else 0
-            },
-            "calls": items
+            "count": response.get("Count", 0)
         }
-    except ClientError as e:
-        return {"statusCode": 500, "error": str(e)}
+    
+    items = response.get("Items", [])
+    
+    # Calculate stats in a single pass
+    total_calls = len(items)
+    total_duration = 0
+    connected_calls = 0
+    for i in items:
+        d = i.get("duration", 0)
+        total_duration += d
+        if d > 0 and i.get("status") == "ended":
+            connected_calls += 1
+    
+    result = {
+        "statusCode": 200,
+        "operation": "get_call_logs",
+        "count": total_calls,
+        "stats": {
+            "totalCalls": total_calls,
+            "connectedCalls": connected_calls,
+            "totalDurationSeconds": total_duration,
+            "avgDurationSeconds": round(total_duration / connected_calls, 2) if connected_calls > 0 else 0
+        }
+    }
+    if mode != "stats":
+        result["calls"] = items
+    return result
+
+
+@client_error_guard
+def handle_backfill_call_stats(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """One-off migration: recompute the CALL_STATS counters from existing call records.
+    
+    Overwrites the counters with totals derived from the CALL items, so run it
+    while no calls are in flight. Pass metaWabaId to rebuild a single WABA.
+    
+    Test Event:
+    {"action": "backfill_call_stats"}
+    """
+    meta_waba_id = event.get("metaWabaId", "")
+    
+    filter_expr = "itemType = :it"
+    expr_values = {":it": "CALL"}
+    if meta_waba_id:
+        filter_expr += " AND wabaMetaId = :waba"
+        expr_values[":waba"] = meta_waba_id
+    
+    items = paginate_items(
+        "scan",
+        FilterExpression=filter_expr,
+        ExpressionAttributeValues=expr_values,
+        ProjectionExpression="wabaMetaId, #st, #du",
+        ExpressionAttributeNames={"#st": "status", "#du": "duration"},
+    )
+    
+    totals: Dict[str, Dict[str, int]] = {}
+    for item in items:
+        waba = item.get("wabaMetaId")
+        if not waba:
+            continue
+        stats = totals.setdefault(waba, {"totalCalls": 0, "connectedCalls": 0, "totalDurationSeconds": 0})
+        stats["totalCalls"] += 1
+        d = item.get("duration", 0)
+        if d > 0 and item.get("status") == "ended":
+            stats["connectedCalls"] += 1
+            stats["totalDurationSeconds"] += d
+    
+    now = iso_now()
+    for waba, stats in totals.items():
+        table().put_item(Item={
+            MESSAGES_PK_NAME: _call_stats_pk(waba),
+            "itemType": "CALL_STATS",
+            "wabaMetaId": waba,
+            "lastUpdatedAt": now,
+            **stats,
+        })
+    
+    return {
+        "statusCode": 200,
+        "operation": "backfill_call_stats",
+        "scanned": len(items),
+        "wabasUpdated": len(totals)
+    }
 
 
+@client_error_guard
 def handle_update_call_settings(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Update call settings for a WABA.
     
@@ -265,33 +484,25 @@ def handle_update_call_settings(event: Dict[str, Any], context: Any) -> Dict[str
     now = iso_now()
     settings_pk = f"CALL_SETTINGS#{meta_waba_id}"
     
-    try:
-        settings_data = {
-            MESSAGES_PK_NAME: settings_pk,
-            "itemType": "CALL_SETTINGS",
-            "wabaMetaId": meta_waba_id,
-            "callingEnabled": settings.get("callingEnabled", True),
-            "businessInitiatedEnabled": settings.get("businessInitiatedEnabled", True),
-            "userInitiatedEnabled": settings.get("userInitiatedEnabled", True),
-            "sipEnabled": settings.get("sipEnabled", False),
-            "maxConcurrentCalls": settings.get("maxConcurrentCalls", 10),
-            "callRecordingEnabled": settings.get("callRecordingEnabled", False),
-            "autoAnswerEnabled": settings.get("autoAnswerEnabled", False),
-            "lastUpdatedAt": now,
-        }
-        
-        store_item(settings_data)
-        
-        return {
-            "statusCode": 200,
-            "operation": "update_call_settings",
-            "settingsPk": settings_pk,
-            "settings": settings_data
-        }
-    except ClientError as e:
-        return {"statusCode": 500, "error": str(e)}
+    settings_data = {
+        MESSAGES_PK_NAME: settings_pk,
+        "itemType": "CALL_SETTINGS",
+        "wabaMetaId": meta_waba_id,
+        **{k: settings.get(k, v) for k, v in _DEFAULT_CALL_SETTINGS.items()},
+        "lastUpdatedAt": now,
+    }
+    
+    store_item(settings_data)
+    
+    return {
+        "statusCode": 200,
+        "operation": "update_call_settings",
+        "settingsPk": settings_pk,
+        "settings": settings_data
+    }
 
 
+@client_error_guard
 def handle_get_call_settings(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Get call settings for a WABA.
     
@@ -309,29 +520,17 @@ def handle_get_call_settings(event: Dict[str, Any], context: Any) -> Dict[str, A
     
     settings_pk = f"CALL_SETTINGS#{meta_waba_id}"
     
-    try:
-        settings = get_item(settings_pk)
-        
-        if not settings:
-            # Return defaults
-            settings = {
-                "callingEnabled": True,
-                "businessInitiatedEnabled": True,
-                "userInitiatedEnabled": True,
-                "sipEnabled": False,
-                "maxConcurrentCalls": 10,
-                "callRecordingEnabled": False,
-                "autoAnswerEnabled": False,
-            }
-        
-        return {
-            "statusCode": 200,
-            "operation": "get_call_settings",
-            "wabaMetaId": meta_waba_id,
-            "settings": settings
-        }
-    except ClientError as e:
-        return {"statusCode": 500, "error": str(e)}
+    settings = get_item(settings_pk, projection=CALL_SETTINGS_FIELDS)
+    
+    if not settings:
+        settings = dict(_DEFAULT_CALL_SETTINGS)
+    
+    return {
+        "statusCode": 200,
+        "operation": "get_call_settings",
+        "wabaMetaId": meta_waba_id,
+        "settings": settings
+    }
 
 
 def handle_create_call_deeplink(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -352,14 +551,10 @@ def handle_create_call_deeplink(event: Dict[str, Any], context: Any) -> Dict[str
         return error
     
     # Clean phone number
-    clean_number = phone_number.replace("+", "").replace(" ", "").replace("-", "")
+    clean_number = phone_number.translate(_PHONE_STRIP)
     
     # WhatsApp deep links
-    deeplinks = {
-        "voice": f"https://wa.me/{clean_number}?call=voice",
-        "video": f"https://wa.me/{clean_number}?call=video",
-        "universal": f"whatsapp://call?phone={clean_number}",
-    }
+    deeplinks = {name: template.format(clean_number) for name, template in _DEEPLINK_TEMPLATES.items()}
     
     return {
         "statusCode": 200,
@@ -5,22 +5,95 @@
 # This module handles media and product carousel messages
 # =============================================================================
 
-import json
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from handlers.base import (
-    table, MESSAGES_PK_NAME, iso_now, store_item, get_phone_arn,
+    client_error_guard, MESSAGES_PK_NAME, iso_now, store_item, store_items_batch, get_phone_arn,
     validate_required_fields, send_whatsapp_message, format_wa_number
 )
 from botocore.exceptions import ClientError
 
+from handlers.dispatcher import HANDLER_POOL_SIZE, get_pool
+
 logger = logging.getLogger()
 
 # Maximum cards in a carousel
 MAX_CAROUSEL_CARDS = 10
 MIN_CAROUSEL_CARDS = 2
+MAX_CARD_BUTTONS = 2
+MAX_CAROUSEL_PRODUCTS = 30
+CAROUSEL_HEADER_TYPES = frozenset({"image", "video"})
+
+# Upper bound on concurrent sends in bulk handlers: sends run as tasks on the
+# shared handler pool, so more tasks than its threads would only queue
+MAX_BULK_SEND_WORKERS = HANDLER_POOL_SIZE
+
+# Upper bound on recipients per bulk invocation, keeping one Lambda run bounded
+MAX_BULK_RECIPIENTS = 500
+
 
+def _validate_cards(cards: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Cheap structural checks run before any phone lookup or send."""
+    if len(cards) < MIN_CAROUSEL_CARDS:
+        return {"statusCode": 400, "error": f"Minimum {MIN_CAROUSEL_CARDS} cards required"}
+    if len(cards) > MAX_CAROUSEL_CARDS:
+        return {"statusCode": 400, "error": f"Maximum {MAX_CAROUSEL_CARDS} cards allowed"}
+    for idx, card in enumerate(cards):
+        if card.get("header", {}).get("type", "image") not in CAROUSEL_HEADER_TYPES:
+            return {"statusCode": 400, "error": f"Card {idx}: header type must be one of {sorted(CAROUSEL_HEADER_TYPES)}"}
+        if len(card.get("buttons", [])) > MAX_CARD_BUTTONS:
+            return {"statusCode": 400, "error": f"Card {idx}: maximum {MAX_CARD_BUTTONS} buttons allowed"}
+    return None
 
+
+def _build_button(btn_idx: int, btn: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a carousel card button component."""
+    btn_type = btn.get("type", "quick_reply")
+    if btn_type == "url" and btn.get("url"):
+        params = [{"type": "text", "text": btn["url"]}]
+    elif btn.get("payload"):
+        params = [{"type": "payload", "payload": btn["payload"]}]
+    else:
+        params = []
+    return {
+        "type": "button",
+        "sub_type": btn_type,
+        "index": str(btn_idx),
+        "parameters": params
+    }
+
+
+def _build_card(idx: int, card: Dict[str, Any]) -> Dict[str, Any]:
+    """Build one carousel card: header, optional body, up to 2 buttons."""
+    g = card.get
+    header = g("header", {})
+    header_type = header.get("type", "image")
+    media_id = header.get("mediaId")
+    link = header.get("link")
+    
+    # Header component (image or video)
+    if media_id:
+        header_params = [{"type": header_type, header_type: {"id": media_id}}]
+    elif link:
+        header_params = [{"type": header_type, header_type: {"link": link}}]
+    else:
+        header_params = []
+    
+    components = [{"type": "header", "parameters": header_params}]
+    body = g("body")
+    if body:
+        components.append({"type": "body", "parameters": [{"type": "text", "text": body}]})
+    components += [_build_button(i, b) for i, b in enumerate(g("buttons", [])[:MAX_CARD_BUTTONS])]
+    
+    return {"card_index": idx, "components": components}
+
+
+def _build_carousel_cards(cards: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Build the interactive carousel card list from request cards."""
+    return [_build_card(i, c) for i, c in enumerate(cards)]
+
+
+@client_error_guard
 def handle_send_media_carousel(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Send interactive media carousel message (images/videos with buttons).
     
@@ -63,101 +136,159 @@ def handle_send_media_carousel(event: Dict[str, Any], context: Any) -> Dict[str,
     if error:
         return error
     
-    if len(cards) < MIN_CAROUSEL_CARDS:
-        return {"statusCode": 400, "error": f"Minimum {MIN_CAROUSEL_CARDS} cards required"}
-    if len(cards) > MAX_CAROUSEL_CARDS:
-        return {"statusCode": 400, "error": f"Maximum {MAX_CAROUSEL_CARDS} cards allowed"}
+    error = _validate_cards(cards)
+    if error:
+        return error
     
     phone_arn = get_phone_arn(meta_waba_id)
     if not phone_arn:
         return {"statusCode": 404, "error": f"Phone not found for WABA: {meta_waba_id}"}
     
-    try:
-        # Build carousel cards
-        carousel_cards = []
-        for idx, card in enumerate(cards):
-            header = card.get("header", {})
-            header_type = header.get("type", "image")
-            
-            card_obj = {
-                "card_index": idx,
-                "components": []
-            }
-            
-            # Header component (image or video)
-            header_component = {"type": "header", "parameters": []}
-            if header.get("mediaId"):
-                header_component["parameters"].append({
-                    "type": header_type,
-                    header_type: {"id": header.get("mediaId")}
-                })
-            elif header.get("link"):
-                header_component["parameters"].append({
-                    "type": header_type,
-                    header_type: {"link": header.get("link")}
-                })
-            card_obj["components"].append(header_component)
-            
-            # Body component
-            if card.get("body"):
-                card_obj["components"].append({
-                    "type": "body",
-                    "parameters": [{"type": "text", "text": card.get("body")}]
-                })
-            
-            # Button components (max 2 per card)
-            buttons = card.get("buttons", [])[:2]
-            for btn_idx, btn in enumerate(buttons):
-                btn_component = {
-                    "type": "button",
-                    "sub_type": btn.get("type", "quick_reply"),
-                    "index": str(btn_idx),
-                    "parameters": []
-                }
-                if btn.get("type") == "url" and btn.get("url"):
-                    btn_component["parameters"].append({"type": "text", "text": btn.get("url")})
-                elif btn.get("payload"):
-                    btn_component["parameters"].append({"type": "payload", "payload": btn.get("payload")})
-                card_obj["components"].append(btn_component)
-            
-            carousel_cards.append(card_obj)
-        
-        payload = {
-            "messaging_product": "whatsapp",
-            "to": format_wa_number(to_number),
-            "type": "interactive",
-            "interactive": {
-                "type": "carousel",
-                "body": {"text": body_text or "Browse our collection"},
-                "action": {
-                    "cards": carousel_cards
-                }
+    carousel_cards = _build_carousel_cards(cards)
+    
+    payload = {
+        "messaging_product": "whatsapp",
+        "to": format_wa_number(to_number),
+        "type": "interactive",
+        "interactive": {
+            "type": "carousel",
+            "body": {"text": body_text or "Browse our collection"},
+            "action": {
+                "cards": carousel_cards
             }
         }
-        
-        result = send_whatsapp_message(phone_arn, payload)
-        
+    }
+    
+    result = send_whatsapp_message(phone_arn, payload)
+    
+    if result.get("success"):
+        store_item({
+            MESSAGES_PK_NAME: f"CAROUSEL#{result.get('messageId')}",
+            "itemType": "MEDIA_CAROUSEL",
+            "wabaMetaId": meta_waba_id,
+            "to": to_number,
+            "cardCount": len(cards),
+            "messageId": result.get("messageId"),
+            "createdAt": iso_now()
+        })
+    
+    return {
+        "statusCode": 200 if result.get("success") else 500,
+        "operation": "send_media_carousel",
+        "cardCount": len(cards),
+        **result
+    }
+
+
+@client_error_guard
+def handle_send_media_carousel_bulk(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """Send the same media carousel to many recipients.
+    
+    The carousel is built once, sends run on a bounded thread pool and
+    audit records are written with a single batch writer.
+    
+    Test Event:
+    {
+        "action": "send_media_carousel_bulk",
+        "metaWabaId": "1347766229904230",
+        "recipients": ["+447447840003", "+919903300044"],
+        "maxConcurrency": 8,
+        "bodyText": "Check out our latest collection!",
+        "cards": [...]
+    }
+    """
+    meta_waba_id = event.get("metaWabaId", "")
+    recipients = event.get("recipients", [])
+    body_text = event.get("bodyText", "")
+    cards = event.get("cards", [])
+    
+    error = validate_required_fields(event, ["metaWabaId", "recipients", "cards"])
+    if error:
+        return error
+    
+    # A bare string would be sent once per character
+    if not isinstance(recipients, list) or not recipients:
+        return {"statusCode": 400, "error": "recipients must be a non-empty list"}
+    if len(recipients) > MAX_BULK_RECIPIENTS:
+        return {"statusCode": 400, "error": f"Maximum {MAX_BULK_RECIPIENTS} recipients per request"}
+    
+    error = _validate_cards(cards)
+    if error:
+        return error
+    
+    try:
+        max_concurrency = int(event.get("maxConcurrency", MAX_BULK_SEND_WORKERS))
+    except (TypeError, ValueError):
+        return {"statusCode": 400, "error": "maxConcurrency must be an integer"}
+    
+    phone_arn = get_phone_arn(meta_waba_id)
+    if not phone_arn:
+        return {"statusCode": 404, "error": f"Phone not found for WABA: {meta_waba_id}"}
+    
+    interactive = {
+        "type": "carousel",
+        "body": {"text": body_text or "Browse our collection"},
+        "action": {
+            "cards": _build_carousel_cards(cards)
+        }
+    }
+    
+    def _send(to_number: str) -> Dict[str, Any]:
+        # One bad recipient must not abort the slice - already-sent messages
+        # still need their result and audit record
+        try:
+            return send_whatsapp_message(phone_arn, {
+                "messaging_product": "whatsapp",
+                "to": format_wa_number(to_number),
+                "type": "interactive",
+                "interactive": interactive
+            })
+        except Exception as e:
+            logger.warning(f"Carousel send to {to_number} failed: {e}")
+            return {"success": False, "error": str(e)}
+    
+    # Sends are I/O bound; a bounded pool overlaps the API round trips
+    workers = max(1, min(max_concurrency, MAX_BULK_SEND_WORKERS, len(recipients)))
+    # Each of the `workers` shared-pool tasks sends a strided slice, bounding concurrency
+    def _send_slice(offset: int) -> List[Dict[str, Any]]:
+        return [_send(to_number) for to_number in recipients[offset::workers]]
+    
+    pool = get_pool()
+    slices = [pool.submit(_send_slice, offset) for offset in range(workers)]
+    sent: List[Dict[str, Any]] = [None] * len(recipients)
+    for offset, future in enumerate(slices):
+        sent[offset::workers] = future.result()
+    
+    results = []
+    audit_items = []
+    now = iso_now()
+    for to_number, result in zip(recipients, sent):
+        results.append({"to": to_number, **result})
         if result.get("success"):
-            store_item({
+            audit_items.append({
                 MESSAGES_PK_NAME: f"CAROUSEL#{result.get('messageId')}",
                 "itemType": "MEDIA_CAROUSEL",
                 "wabaMetaId": meta_waba_id,
                 "to": to_number,
                 "cardCount": len(cards),
                 "messageId": result.get("messageId"),
-                "createdAt": iso_now()
+                "createdAt": now
             })
-        
-        return {
-            "statusCode": 200 if result.get("success") else 500,
-            "operation": "send_media_carousel",
-            "cardCount": len(cards),
-            **result
-        }
-    except ClientError as e:
-        return {"statusCode": 500, "error": str(e)}
+    
+    if audit_items:
+        store_items_batch(audit_items)
+    
+    return {
+        "statusCode": 200 if audit_items else 500,
+        "operation": "send_media_carousel_bulk",
+        "cardCount": len(cards),
+        "sentCount": len(audit_items),
+        "failedCount": len(results) - len(audit_items),
+        "results": results
+    }
 
 
+@client_error_guard
 def handle_send_product_carousel(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Send interactive product carousel message from catalog.
     
@@ -193,76 +324,74 @@ def handle_send_product_carousel(event: Dict[str, Any], context: Any) -> Dict[st
     if error:
         return error
     
-    phone_arn = get_phone_arn(meta_waba_id)
-    if not phone_arn:
-        return {"statusCode": 404, "error": f"Phone not found for WABA: {meta_waba_id}"}
-    
     # Count total products
     total_products = sum(len(s.get("productIds", [])) for s in sections)
     if total_products < 1:
         return {"statusCode": 400, "error": "At least 1 product required"}
-    if total_products > 30:
-        return {"statusCode": 400, "error": "Maximum 30 products allowed"}
+    if total_products > MAX_CAROUSEL_PRODUCTS:
+        return {"statusCode": 400, "error": f"Maximum {MAX_CAROUSEL_PRODUCTS} products allowed"}
     
-    try:
-        # Build product sections
-        product_sections = []
-        for section in sections:
-            product_items = [
-                {"product_retailer_id": pid}
-                for pid in section.get("productIds", [])
-            ]
-            product_sections.append({
-                "title": section.get("title", "Products"),
-                "product_items": product_items
-            })
-        
-        interactive = {
-            "type": "product_list",
-            "body": {"text": body_text or "Browse our products"},
-            "action": {
-                "catalog_id": catalog_id,
-                "sections": product_sections
-            }
-        }
-        
-        if header_text:
-            interactive["header"] = {"type": "text", "text": header_text}
-        if footer_text:
-            interactive["footer"] = {"text": footer_text}
-        
-        payload = {
-            "messaging_product": "whatsapp",
-            "to": format_wa_number(to_number),
-            "type": "interactive",
-            "interactive": interactive
+    phone_arn = get_phone_arn(meta_waba_id)
+    if not phone_arn:
+        return {"statusCode": 404, "error": f"Phone not found for WABA: {meta_waba_id}"}
+    
+    # Build product sections
+    product_sections = []
+    for section in sections:
+        product_items = [
+            {"product_retailer_id": pid}
+            for pid in section.get("productIds", [])
+        ]
+        product_sections.append({
+            "title": section.get("title", "Products"),
+            "product_items": product_items
+        })
+    
+    interactive = {
+        "type": "product_list",
+        "body": {"text": body_text or "Browse our products"},
+        "action": {
+            "catalog_id": catalog_id,
+            "sections": product_sections
         }
-        
-        result = send_whatsapp_message(phone_arn, payload)
-        
-        if result.get("success"):
-            store_item({
-                MESSAGES_PK_NAME: f"PRODUCT_CAROUSEL#{result.get('messageId')}",
-                "itemType": "PRODUCT_CAROUSEL",
-                "wabaMetaId": meta_waba_id,
-                "to": to_number,
-                "catalogId": catalog_id,
-                "productCount": total_products,
-                "messageId": result.get("messageId"),
-                "createdAt": iso_now()
-            })
-        
-        return {
-            "statusCode": 200 if result.get("success") else 500,
-            "operation": "send_product_carousel",
+    }
+    
+    if header_text:
+        interactive["header"] = {"type": "text", "text": header_text}
+    if footer_text:
+        interactive["footer"] = {"text": footer_text}
+    
+    payload = {
+        "messaging_product": "whatsapp",
+        "to": format_wa_number(to_number),
+        "type": "interactive",
+        "interactive": interactive
+    }
+    
+    result = send_whatsapp_message(phone_arn, payload)
+    
+    if result.get("success"):
+        store_item({
+            MESSAGES_PK_NAME: f"PRODUCT_CAROUSEL#{result.get('messageId')}",
+            "itemType": "PRODUCT_CAROUSEL",
+            "wabaMetaId": meta_waba_id,
+            "to": to_number,
             "catalogId": catalog_id,
             "productCount": total_products,
-            **result
-        }
-    except ClientError as e:
-        return {"statusCode": 500, "error": str(e)}
+            "messageId": result.get("messageId"),
+            "createdAt": iso_now()
+        })
+    
+    return {
+        "statusCode": 200 if result.get("success") else 500,
+        "operation": "send_product_carousel",
+        "catalogId": catalog_id,
+        "productCount": total_products,
+        **result
+    }
 
 
+@client_error_guard
 def handle_send_single_product(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Send single product message (SPM) from catalog.
     
@@ -291,34 +420,31 @@ def handle_send_single_product(event: Dict[str, Any], context: Any) -> Dict[str,
     if not phone_arn:
         return {"statusCode": 404, "error": f"Phone not found for WABA: {meta_waba_id}"}
     
-    try:
-        interactive = {
-            "type": "product",
-            "body": {"text": body_text or "View product details"},
-            "action": {
-                "catalog_id": catalog_id,
-                "product_retailer_id": product_id
-            }
-        }
-        
-        if footer_text:
-            interactive["footer"] = {"text": footer_text}
-        
-        payload = {
-            "messaging_product": "whatsapp",
-            "to": format_wa_number(to_number),
-            "type": "interactive",
-            "interactive": interactive
-        }
-        
-        result = send_whatsapp_message(phone_arn, payload)
-        
-        return {
-            "statusCode": 200 if result.get("success") else 500,
-            "operation": "send_single_product",
-            "catalogId": catalog_id,
-            "productId": product_id,
-            **result
+    interactive = {
+        "type": "product",
+        "body": {"text": body_text or "View product details"},
+        "action": {
+            "catalog_id": catalog_id,
+            "product_retailer_id": product_id
         }
-    except ClientError as e:
-        return {"statusCode": 500, "error": str(e)}
+    }
+    
+    if footer_text:
+        interactive["footer"] = {"text": footer_text}
+    
+    payload = {
+        "messaging_product": "whatsapp",
+        "to": format_wa_number(to_number),
+        "type": "interactive",
+        "interactive": interactive
+    }
+    
+    result = send_whatsapp_message(phone_arn, payload)
+    
+    return {
+        "statusCode": 200 if result.get("success") else 500,
+        "operation": "send_single_product",
+        "catalogId": catalog_id,
+        "productId": product_id,
+        **result
+    }
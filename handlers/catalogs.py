@@ -3,16 +3,34 @@
 
 import json
 import logging
+import uuid
 from typing import Any, Dict, List
 from handlers.base import (
     table, s3, MESSAGES_PK_NAME, MEDIA_BUCKET, MEDIA_PREFIX,
-    iso_now, store_item, get_item, validate_required_fields,
+    iso_now, store_item, store_items_batch, get_item, validate_required_fields, paginate_items,
     get_phone_arn, send_whatsapp_message, format_wa_number
 )
 from botocore.exceptions import ClientError
 
 logger = logging.getLogger()
 
+# Required event fields per handler
+_UPLOAD_CATALOG_REQUIRED = ("metaWabaId", "catalogName", "products")
+_GET_PRODUCTS_REQUIRED = ("catalogId",)
+_SEND_CATALOG_REQUIRED = ("metaWabaId", "to", "catalogId")
+
+# GSI over catalog items: PK catalogId, SK itemTypeCategory ("PRODUCT#<category>")
+# Migration: products uploaded before the index carry no itemTypeCategory -
+# run the backfill_catalog_products action once before creating the GSI.
+CATALOG_ITEMS_GSI = "gsi_catalog_items"
+_PRODUCT_KEY_BY_CATEGORY = "catalogId = :cid AND itemTypeCategory = :itc"
+_PRODUCT_KEY_ALL = "catalogId = :cid AND begins_with(itemTypeCategory, :itc)"
+
+# Scan fallback filter; per-request values are merged over the constant part
+_PRODUCT_FILTER = "itemType = :it AND catalogId = :cid"
+_PRODUCT_FILTER_VALUES = {":it": "PRODUCT"}
+_PRODUCT_BACKFILL_FILTER = "itemType = :it AND attribute_not_exists(itemTypeCategory)"
+
 
 def handle_upload_catalog(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Upload product catalog.
@@ -50,12 +68,12 @@ def handle_upload_catalog(event: Dict[str, Any], context: Any) -> Dict[str, Any]
     catalog_name = event.get("catalogName", "")
     products = event.get("products", [])
     
-    error = validate_required_fields(event, ["metaWabaId", "catalogName", "products"])
+    error = validate_required_fields(event, _UPLOAD_CATALOG_REQUIRED)
     if error:
         return error
     
     now = iso_now()
-    catalog_id = f"CATALOG_{now.replace(':', '').replace('-', '').replace('.', '')}"
+    catalog_id = f"CATALOG_{uuid.uuid4().hex}"
     catalog_pk = f"CATALOG#{meta_waba_id}#{catalog_id}"
     
     try:
@@ -73,11 +91,10 @@ def handle_upload_catalog(event: Dict[str, Any], context: Any) -> Dict[str, Any]
         }
         store_item(catalog_data)
         
-        # Store each product
-        for product in products:
-            product_pk = f"PRODUCT#{catalog_id}#{product.get('retailerId', '')}"
-            store_item({
-                MESSAGES_PK_NAME: product_pk,
+        # Store products in BatchWriteItem chunks of 25
+        store_items_batch([
+            {
+                MESSAGES_PK_NAME: f"PRODUCT#{catalog_id}#{product.get('retailerId', '')}",
                 "itemType": "PRODUCT",
                 "catalogId": catalog_id,
                 "wabaMetaId": meta_waba_id,
@@ -88,9 +105,12 @@ def handle_upload_catalog(event: Dict[str, Any], context: Any) -> Dict[str, Any]
                 "currency": product.get("currency", "INR"),
                 "imageUrl": product.get("imageUrl", ""),
                 "category": product.get("category", ""),
+                "itemTypeCategory": f"PRODUCT#{product.get('category', '')}",
                 "availability": product.get("availability", "in_stock"),
                 "createdAt": now,
-            })
+            }
+            for product in products
+        ])
         
         return {
             "statusCode": 200,
@@ -118,25 +138,39 @@ def handle_get_catalog_products(event: Dict[str, Any], context: Any) -> Dict[str
     category = event.get("category", "")
     limit = event.get("limit", 50)
     
-    error = validate_required_fields(event, ["catalogId"])
+    error = validate_required_fields(event, _GET_PRODUCTS_REQUIRED)
     if error:
         return error
     
     try:
-        filter_expr = "itemType = :it AND catalogId = :cid"
-        expr_values = {":it": "PRODUCT", ":cid": catalog_id}
-        
-        if category:
-            filter_expr += " AND category = :cat"
-            expr_values[":cat"] = category
-        
-        response = table().scan(
-            FilterExpression=filter_expr,
-            ExpressionAttributeValues=expr_values,
-            Limit=limit
-        )
-        
-        items = response.get("Items", [])
+        try:
+            items = paginate_items(
+                "query",
+                max_items=limit,
+                IndexName=CATALOG_ITEMS_GSI,
+                KeyConditionExpression=_PRODUCT_KEY_BY_CATEGORY if category else _PRODUCT_KEY_ALL,
+                ExpressionAttributeValues={":cid": catalog_id, ":itc": f"PRODUCT#{category}"},
+                Limit=limit
+            )
+        except ClientError as e:
+            # If GSI doesn't exist, fall back to scan
+            if "ValidationException" not in str(e):
+                raise
+            logger.warning(f"{CATALOG_ITEMS_GSI} unavailable, falling back to scan")
+            filter_expr = _PRODUCT_FILTER
+            expr_values = {**_PRODUCT_FILTER_VALUES, ":cid": catalog_id}
+            
+            if category:
+                filter_expr += " AND category = :cat"
+                expr_values[":cat"] = category
+            
+            items = paginate_items(
+                "scan",
+                max_items=limit,
+                FilterExpression=filter_expr,
+                ExpressionAttributeValues=expr_values,
+                Limit=limit
+            )
         
         return {
             "statusCode": 200,
@@ -190,9 +224,9 @@ def handle_send_catalog_message(event: Dict[str, Any], context: Any) -> Dict[str
     footer = event.get("footer", "")
     sections = event.get("sections", [])
     
-    error = validate_required_fields(event, ["metaWabaId", "to", "catalogId"])
-    if error:
-        return error
+    # Fields are already in locals; only build the error on the miss path
+    if not (meta_waba_id and to_number and catalog_id):
+        return validate_required_fields(event, _SEND_CATALOG_REQUIRED)
     
     phone_arn = get_phone_arn(meta_waba_id)
     if not phone_arn:
@@ -201,55 +235,47 @@ def handle_send_catalog_message(event: Dict[str, Any], context: Any) -> Dict[str
     try:
         if message_type == "product":
             # Single Product Message (SPM)
-            payload = {
-                "messaging_product": "whatsapp",
-                "to": format_wa_number(to_number),
-                "type": "interactive",
-                "interactive": {
-                    "type": "product",
-                    "body": {"text": body} if body else None,
-                    "footer": {"text": footer} if footer else None,
-                    "action": {
-                        "catalog_id": catalog_id,
-                        "product_retailer_id": product_retailer_id
-                    }
+            interactive = {
+                "type": "product",
+                "action": {
+                    "catalog_id": catalog_id,
+                    "product_retailer_id": product_retailer_id
                 }
             }
         else:
             # Multi-Product Message (MPM)
-            mpm_sections = []
-            for section in sections:
-                mpm_sections.append({
+            mpm_sections = [
+                {
                     "title": section.get("title", "Products"),
                     "product_items": [
-                        {"product_retailer_id": pid} 
+                        {"product_retailer_id": pid}
                         for pid in section.get("productRetailerIds", [])
                     ]
-                })
-            
-            payload = {
-                "messaging_product": "whatsapp",
-                "to": format_wa_number(to_number),
-                "type": "interactive",
-                "interactive": {
-                    "type": "product_list",
-                    "header": {"type": "text", "text": header} if header else None,
-                    "body": {"text": body} if body else None,
-                    "footer": {"text": footer} if footer else None,
-                    "action": {
-                        "catalog_id": catalog_id,
-                        "sections": mpm_sections
-                    }
+                }
+                for section in sections
+            ]
+            interactive = {
+                "type": "product_list",
+                "action": {
+                    "catalog_id": catalog_id,
+                    "sections": mpm_sections
                 }
             }
+            if header:
+                interactive["header"] = {"type": "text", "text": header}
+        
+        # Optional parts are only added when set
+        if body:
+            interactive["body"] = {"text": body}
+        if footer:
+            interactive["footer"] = {"text": footer}
         
-        # Clean None values
-        if payload["interactive"].get("body") is None:
-            del payload["interactive"]["body"]
-        if payload["interactive"].get("footer") is None:
-            del payload["interactive"]["footer"]
-        if payload["interactive"].get("header") is None:
-            del payload["interactive"]["header"]
+        payload = {
+            "messaging_product": "whatsapp",
+            "to": format_wa_number(to_number),
+            "type": "interactive",
+            "interactive": interactive
+        }
         
         result = send_whatsapp_message(phone_arn, payload)
         
@@ -261,3 +287,37 @@ def handle_send_catalog_message(event: Dict[str, Any], context: Any) -> Dict[str
         }
     except ClientError as e:
         return {"statusCode": 500, "error": str(e)}
+
+
+def handle_backfill_catalog_products(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """One-off migration: set itemTypeCategory on products uploaded before gsi_catalog_items.
+    
+    Idempotent - only products still missing the attribute are touched. Run it
+    before creating the GSI so no product drops out of get_catalog_products.
+    
+    Test Event:
+    {"action": "backfill_catalog_products"}
+    """
+    try:
+        items = paginate_items(
+            "scan",
+            FilterExpression=_PRODUCT_BACKFILL_FILTER,
+            ExpressionAttributeValues=_PRODUCT_FILTER_VALUES,
+            ProjectionExpression="#pk, category",
+            ExpressionAttributeNames={"#pk": MESSAGES_PK_NAME},
+        )
+        
+        for item in items:
+            table().update_item(
+                Key={MESSAGES_PK_NAME: item[MESSAGES_PK_NAME]},
+                UpdateExpression="SET itemTypeCategory = :itc",
+                ExpressionAttributeValues={":itc": f"PRODUCT#{item.get('category', '')}"},
+            )
+        
+        return {
+            "statusCode": 200,
+            "operation": "backfill_catalog_products",
+            "updated": len(items)
+        }
+    except ClientError as e:
+        return {"statusCode": 500, "error": str(e)}
@@ -9,6 +9,7 @@
 import json
 import logging
 import os
+import time
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 
@@ -17,12 +18,24 @@ from handlers.base import (
     META_API_VERSION, WABA_PHONE_MAP,
     iso_now, jdump, safe, format_wa_number, origination_id_for_api, arn_suffix,
     get_waba_config, get_phone_arn, success_response, error_response,
+    paginate_items, paginate_count,
     SUPPORTED_MEDIA_TYPES, get_supported_mime_types,
 )
 from botocore.exceptions import ClientError
 
+from handlers.dispatcher import get_pool
+
 logger = logging.getLogger(__name__)
 
+# Constant read expressions (boto3 deep-copies request params, so sharing is safe)
+_ITEM_TYPE_FILTER = "itemType = :it"
+_DIRECTION_KEY = "direction = :d"
+_QUALITY_RATING_VALUES = {":it": "QUALITY_RATING"}
+_MESSAGE_VALUES = {":it": "MESSAGE"}
+_CONVERSATION_VALUES = {":it": "CONVERSATION"}
+_INBOUND_VALUES = {":d": "INBOUND"}
+_OUTBOUND_VALUES = {":d": "OUTBOUND"}
+
 
 # =============================================================================
 # PING
@@ -51,22 +64,29 @@ def handle_get_config(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     
     Returns environment configuration and WABA mappings.
     """
+    # The two reads are independent - run them concurrently on the shared pool
+    pool = get_pool()
+    
     # Get quality ratings from DynamoDB
+    quality_future = pool.submit(
+        paginate_items,
+        "scan",
+        FilterExpression=_ITEM_TYPE_FILTER,
+        ExpressionAttributeValues=_QUALITY_RATING_VALUES,
+    )
+    
+    # Get infrastructure config
+    infra_future = pool.submit(table().get_item, Key={MESSAGES_PK_NAME: "CONFIG#INFRA"})
+    
     quality_items = []
     try:
-        response = table().scan(
-            FilterExpression="itemType = :it",
-            ExpressionAttributeValues={":it": "QUALITY_RATING"},
-        )
-        quality_items = response.get("Items", [])
+        quality_items = quality_future.result()
     except ClientError:
         pass
     
-    # Get infrastructure config
     infra_item = None
     try:
-        response = table().get_item(Key={MESSAGES_PK_NAME: "CONFIG#INFRA"})
-        infra_item = response.get("Item")
+        infra_item = infra_future.result().get("Item")
     except ClientError:
         pass
     
@@ -103,11 +123,11 @@ def handle_get_quality(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             return error_response(f"Quality rating not found for WABA: {meta_waba_id}", 404)
         
         # Get all quality ratings
-        response = table().scan(
-            FilterExpression="itemType = :it",
-            ExpressionAttributeValues={":it": "QUALITY_RATING"},
+        items = paginate_items(
+            "scan",
+            FilterExpression=_ITEM_TYPE_FILTER,
+            ExpressionAttributeValues=_QUALITY_RATING_VALUES,
         )
-        items = response.get("Items", [])
         
         return success_response("get_quality", count=len(items), qualityRatings=items)
     except ClientError as e:
@@ -130,43 +150,51 @@ def handle_get_stats(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         inbound_count = 0
         outbound_count = 0
         
-        # Scan for message counts (limited for performance)
-        response = table().scan(
-            FilterExpression="itemType = :it",
-            ExpressionAttributeValues={":it": "MESSAGE"},
-            Select="COUNT",
-            Limit=10000,
+        # The four counts are independent - run them concurrently on the shared pool
+        pool = get_pool()
+        
+        # Scan for message counts (summed across all 1 MB pages)
+        messages_future = pool.submit(
+            paginate_count,
+            "scan",
+            FilterExpression=_ITEM_TYPE_FILTER,
+            ExpressionAttributeValues=_MESSAGE_VALUES,
         )
-        total_messages = response.get("Count", 0)
         
         # Count conversations
-        conv_response = table().scan(
-            FilterExpression="itemType = :it",
-            ExpressionAttributeValues={":it": "CONVERSATION"},
-            Select="COUNT",
+        conversations_future = pool.submit(
+            paginate_count,
+            "scan",
+            FilterExpression=_ITEM_TYPE_FILTER,
+            ExpressionAttributeValues=_CONVERSATION_VALUES,
         )
-        total_conversations = conv_response.get("Count", 0)
         
         # Get inbound/outbound counts
+        inbound_future = pool.submit(
+            paginate_count,
+            "query",
+            IndexName="gsi_direction",
+            KeyConditionExpression=_DIRECTION_KEY,
+            ExpressionAttributeValues=_INBOUND_VALUES,
+        )
+        outbound_future = pool.submit(
+            paginate_count,
+            "query",
+            IndexName="gsi_direction",
+            KeyConditionExpression=_DIRECTION_KEY,
+            ExpressionAttributeValues=_OUTBOUND_VALUES,
+        )
+        
+        total_messages = messages_future.result()
+        total_conversations = conversations_future.result()
+        
         try:
-            inbound_resp = table().query(
-                IndexName="gsi_direction",
-                KeyConditionExpression="direction = :d",
-                ExpressionAttributeValues={":d": "INBOUND"},
-                Select="COUNT",
-            )
-            inbound_count = inbound_resp.get("Count", 0)
+            inbound_count = inbound_future.result()
         except ClientError:
             pass
         
         try:
-            outbound_resp = table().query(
-                IndexName="gsi_direction",
-                KeyConditionExpression="direction = :d",
-                ExpressionAttributeValues={":d": "OUTBOUND"},
-                Select="COUNT",
-            )
-            outbound_count = outbound_resp.get("Count", 0)
+            outbound_count = outbound_future.result()
         except ClientError:
             pass
         
@@ -282,20 +310,26 @@ def handle_get_infra(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 # GET MEDIA TYPES
 # =============================================================================
 
+# CONFIG#MEDIA_TYPES rarely changes - serve it from memory for a short TTL
+MEDIA_TYPES_CACHE_TTL = 60
+_media_types_cache = {"value": None, "expires": 0.0}
+
+
 def handle_get_media_types(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Get supported media types from DynamoDB.
     
     Returns cached media type configuration.
     """
+    now_ts = time.monotonic()
+    if _media_types_cache["expires"] > now_ts:
+        return success_response("get_media_types", mediaTypes=_media_types_cache["value"])
+    
     try:
         response = table().get_item(Key={MESSAGES_PK_NAME: "CONFIG#MEDIA_TYPES"})
-        item = response.get("Item")
-        
-        if item:
-            return success_response("get_media_types", mediaTypes=item)
-        
-        # Return default if not cached
-        return success_response("get_media_types", mediaTypes=SUPPORTED_MEDIA_TYPES)
+        # Fall back to defaults if not cached in DynamoDB (also cached, as a negative hit)
+        media_types = response.get("Item") or SUPPORTED_MEDIA_TYPES
+        _media_types_cache.update(value=media_types, expires=now_ts + MEDIA_TYPES_CACHE_TTL)
+        return success_response("get_media_types", mediaTypes=media_types)
     except ClientError as e:
         return error_response(str(e), 500)
 
@@ -323,16 +357,22 @@ def handle_get_supported_formats(event: Dict[str, Any], context: Any) -> Dict[st
 # LIST ACTIONS
 # =============================================================================
 
+# (categories, total) - fixed for the life of the container, built on first use
+_ACTIONS_LISTING = None
+
+
 def handle_list_actions(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """List all available actions.
     
     Returns categorized list of all handler actions.
     """
-    # Import here to avoid circular imports
-    from handlers.extended import get_extended_actions_by_category, get_extended_handler_count
+    global _ACTIONS_LISTING
+    if _ACTIONS_LISTING is None:
+        # Import here to avoid circular imports
+        from handlers.extended import get_extended_actions_by_category, get_extended_handler_count
+        _ACTIONS_LISTING = (get_extended_actions_by_category(), get_extended_handler_count())
     
-    categories = get_extended_actions_by_category()
-    total = get_extended_handler_count()
+    categories, total = _ACTIONS_LISTING
     
     return success_response(
         "list_actions",
@@ -345,32 +385,32 @@ def handle_list_actions(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 # GET BEST PRACTICES
 # =============================================================================
 
+_BEST_PRACTICES = {
+    "messaging": {
+        "tip": "Use send_template for marketing messages to avoid rate limits",
+        "example": {"action": "send_template", "templateName": "hello_world"},
+    },
+    "media": {
+        "tip": "Upload media to S3 first, then use s3Key for sending",
+        "example": {"action": "send_image", "s3Key": "WhatsApp/media/image.jpg"},
+    },
+    "queries": {
+        "tip": "Use specific GSI queries instead of scans for better performance",
+        "example": {"action": "get_messages", "direction": "INBOUND", "limit": 20},
+    },
+    "conversations": {
+        "tip": "Use mark_conversation_read to reset unread counts efficiently",
+        "example": {"action": "mark_conversation_read", "phoneId": "xxx", "fromNumber": "447447840003"},
+    },
+}
+
+
 def handle_get_best_practices(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Get best practices for using Lambda handlers.
     
     Returns tips and recommendations.
     """
-    return success_response(
-        "get_best_practices",
-        bestPractices={
-            "messaging": {
-                "tip": "Use send_template for marketing messages to avoid rate limits",
-                "example": {"action": "send_template", "templateName": "hello_world"},
-            },
-            "media": {
-                "tip": "Upload media to S3 first, then use s3Key for sending",
-                "example": {"action": "send_image", "s3Key": "WhatsApp/media/image.jpg"},
-            },
-            "queries": {
-                "tip": "Use specific GSI queries instead of scans for better performance",
-                "example": {"action": "get_messages", "direction": "INBOUND", "limit": 20},
-            },
-            "conversations": {
-                "tip": "Use mark_conversation_read to reset unread counts efficiently",
-                "example": {"action": "mark_conversation_read", "phoneId": "xxx", "fromNumber": "447447840003"},
-            },
-        },
-    )
+    return success_response("get_best_practices", bestPractices=_BEST_PRACTICES)
 
 
 # =============================================================================
@@ -16,18 +16,23 @@
 #   - wecare-digital-orders: Order payments
 # =============================================================================
 
-import json
 import logging
 import os
-from typing import Any, Dict, List
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List
 from datetime import datetime, timezone, timedelta
-from decimal import Decimal
+from itertools import chain
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+from handlers.dispatcher import get_pool
+
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 
 # =============================================================================
 # TABLE CONFIGURATION
@@ -42,27 +47,149 @@ TABLES = {
     "shortlinks": os.environ.get("SHORTLINKS_TABLE", "wecare-digital-shortlinks"),
 }
 
-_tables = {}
+# Keep pooled TLS connections alive across warm invocations; fail fast on connect
+_DDB_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=25,
+    connect_timeout=2,
+    read_timeout=10,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+
+# Built at import so Lambda's init phase pays for the boto3 factory work once
+_DDB = boto3.resource(
+    "dynamodb",
+    region_name=os.environ.get("AWS_REGION", "ap-south-1"),
+    config=_DDB_CONFIG,
+)
+_tables = {name: _DDB.Table(table_name) for name, table_name in TABLES.items()}
 
 def get_table(name: str):
     if name not in _tables:
-        table_name = TABLES.get(name, name)
-        _tables[name] = boto3.resource("dynamodb").Table(table_name)
+        _tables[name] = _DDB.Table(name)
     return _tables[name]
 
-def now(): return datetime.now(timezone.utc).isoformat()
+_UTC = timezone.utc
+
+def now(): return datetime.now(_UTC).isoformat()
 
+SUMMARY_SECTION_TIMEOUT = 10
+
+# =============================================================================
+# READ EXPRESSIONS
 # =============================================================================
-# DECIMAL ENCODER
+# Constant parts of every stats/list read; per-request predicates are merged
+# over these. Plain dicts - boto3 deep-copies params, which mappingproxy can't.
+_MESSAGE_FILTER = "itemType = :it"
+_DIRECTION_VALUES = {
+    "INBOUND": {":it": "MESSAGE", ":dir": "INBOUND"},
+    "OUTBOUND": {":it": "MESSAGE", ":dir": "OUTBOUND"},
+}
+_INBOUND_STATS_PROJECTION = "#ty, #fr"
+_INBOUND_STATS_NAMES = {"#ty": "type", "#fr": "from"}
+_OUTBOUND_STATS_PROJECTION = "#ty, deliveryStatus, #to"
+_OUTBOUND_STATS_NAMES = {"#ty": "type", "#to": "to"}
+
+_TEMPLATE_FILTER = "itemType = :it"
+_TEMPLATE_VALUES = {":it": "TEMPLATE"}
+_TEMPLATE_STATS_PROJECTION = "#st, category, #lang"
+_TEMPLATE_STATS_NAMES = {"#st": "status", "#lang": "language"}
+
+_FLOW_FILTER = "begins_with(pk, :prefix)"
+_FLOW_VALUES = {":prefix": "FLOW#"}
+_FLOW_STATS_PROJECTION = "#st, flowId"
+_FLOW_STATS_NAMES = {"#st": "status"}
+
+# payments / shortlinks tables discriminate on the reserved word "type"
+_TYPE_FILTER = "#t = :t"
+_TYPE_NAMES = {"#t": "type"}
+_PAYMENT_VALUES = {":t": "PAYMENT"}
+_PAYMENT_STATS_PROJECTION = "#st, amount"
+_PAYMENT_STATS_NAMES = {"#t": "type", "#st": "status"}
+_LINK_VALUES = {":t": "LINK"}
+_LINK_STATS_PROJECTION = "clicks, active"
+
 # =============================================================================
-class DecimalEncoder(json.JSONEncoder):
-    def default(self, o):
-        if isinstance(o, Decimal):
-            return float(o) if o % 1 else int(o)
-        return super().default(o)
+# PAGED READS
+# =============================================================================
+def _iter_items(read, max_items: int = None, max_pages: int = None, **kwargs) -> Iterator[Dict]:
+    """Yield items from a query/scan one page at a time, following LastEvaluatedKey."""
+    count = 0
+    pages = 0
+    while True:
+        response = read(**kwargs)
+        pages += 1
+        for item in response.get("Items", []):
+            yield item
+            count += 1
+            if max_items and count >= max_items:
+                return
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key or (max_pages and pages >= max_pages):
+            return
+        kwargs["ExclusiveStartKey"] = last_key
+
+# GSI over messages: PK direction, sorted newest-first with ScanIndexForward=False
+DIRECTION_GSI = "gsi_direction"
+
+# Page budget for direction stats reads (each page is at most 1 MB read)
+STATS_MAX_PAGES = int(os.environ.get("DASHBOARD_STATS_MAX_PAGES", "20"))
+
+# Timestamp each direction is windowed on by the stats "days" argument
+_DIRECTION_TIME_ATTR = {"INBOUND": "receivedAt", "OUTBOUND": "sentAt"}
+
+def _since(days: int) -> str:
+    """ISO timestamp for the start of a trailing window of days."""
+    return (datetime.now(_UTC) - timedelta(days=days)).isoformat()
+
+def _read_direction(table, direction: str, limit: int = None, filters: List[str] = None,
+                    values: Dict = None, names: Dict = None,
+                    projection: str = None, max_pages: int = None) -> Iterator[Dict]:
+    """Read MESSAGE items for one direction via gsi_direction, or scan if the index is missing.
+    
+    Reading stops at limit items or max_pages pages, whichever comes first.
+    """
+    kwargs = {
+        "FilterExpression": " AND ".join([_MESSAGE_FILTER, *filters]) if filters else _MESSAGE_FILTER,
+        "ExpressionAttributeValues": {**_DIRECTION_VALUES[direction], **values} if values else _DIRECTION_VALUES[direction],
+    }
+    if limit:
+        kwargs["Limit"] = limit
+    if projection:
+        kwargs["ProjectionExpression"] = projection
+    if names:
+        kwargs["ExpressionAttributeNames"] = names
+    
+    try:
+        yield from _iter_items(
+            table.query,
+            max_items=limit,
+            max_pages=max_pages,
+            IndexName=DIRECTION_GSI,
+            KeyConditionExpression="direction = :dir",
+            ScanIndexForward=False,
+            **kwargs
+        )
+    except ClientError as e:
+        # If GSI doesn't exist, fall back to scan
+        if "ValidationException" not in str(e):
+            raise
+        logger.warning(f"{DIRECTION_GSI} unavailable, falling back to scan")
+        kwargs["FilterExpression"] += " AND direction = :dir"
+        yield from _iter_items(table.scan, max_items=limit, max_pages=max_pages, **kwargs)
+
+# Stat aggregators without a usable key scan in parallel segments
+SCAN_SEGMENTS = 4
 
-def to_json(obj):
-    return json.dumps(obj, cls=DecimalEncoder, default=str)
+def _parallel_scan(table, total_segments: int = SCAN_SEGMENTS, **kwargs) -> Iterator[Dict]:
+    """Scan a table as total_segments concurrent, fully paginated segments."""
+    # Own short-lived pool: callers may already be running on the shared get_pool()
+    def scan_segment(segment: int) -> List[Dict]:
+        return list(_iter_items(table.scan, Segment=segment, TotalSegments=total_segments, **kwargs))
+    
+    with ThreadPoolExecutor(max_workers=total_segments) as pool:
+        segments = [pool.submit(scan_segment, i) for i in range(total_segments)]
+        return chain.from_iterable([f.result() for f in segments])
 
 # =============================================================================
 # INBOUND MESSAGES DASHBOARD
@@ -73,48 +200,50 @@ def get_inbound_stats(event: Dict, context: Any) -> Dict:
     Test Event:
     {"action": "get_inbound_stats", "days": 7}
     """
-    days = event.get("days", 7)
+    try:
+        days = int(event.get("days", 7))
+    except (TypeError, ValueError):
+        return {"statusCode": 400, "error": "days must be an integer"}
     waba_id = event.get("metaWabaId", "")
     
     try:
         table = get_table("main")
         
-        # Scan for inbound messages
-        filter_expr = "itemType = :it AND direction = :dir"
-        expr_values = {":it": "MESSAGE", ":dir": "INBOUND"}
+        # Query inbound messages
+        filters = [f"{_DIRECTION_TIME_ATTR['INBOUND']} >= :since"]
+        expr_values = {":since": _since(days)}
         
         if waba_id:
-            filter_expr += " AND wabaMetaId = :waba"
+            filters.append("wabaMetaId = :waba")
             expr_values[":waba"] = waba_id
         
-        response = table.scan(
-            FilterExpression=filter_expr,
-            ExpressionAttributeValues=expr_values,
-            Limit=1000
+        items = _read_direction(
+            table, "INBOUND", filters=filters, values=expr_values,
+            names=_INBOUND_STATS_NAMES, projection=_INBOUND_STATS_PROJECTION,
+            max_pages=STATS_MAX_PAGES,
         )
         
-        items = response.get("Items", [])
-        
-        # Calculate stats
-        total = len(items)
-        by_type = {}
-        by_sender = {}
+        # Calculate stats page by page; items are never held as a list
+        total = 0
+        by_type = Counter()
+        by_sender = Counter()
         
         for item in items:
+            total += 1
             msg_type = item.get("type", "unknown")
             sender = item.get("from", "unknown")
             
-            by_type[msg_type] = by_type.get(msg_type, 0) + 1
-            by_sender[sender] = by_sender.get(sender, 0) + 1
+            by_type[msg_type] += 1
+            by_sender[sender] += 1
         
         # Top senders
-        top_senders = sorted(by_sender.items(), key=lambda x: x[1], reverse=True)[:10]
+        top_senders = by_sender.most_common(10)
         
         return {
             "statusCode": 200,
             "operation": "get_inbound_stats",
             "total": total,
-            "byType": by_type,
+            "byType": dict(by_type),
             "topSenders": [{"phone": s[0], "count": s[1]} for s in top_senders],
             "days": days,
         }
@@ -134,28 +263,20 @@ def get_inbound_messages(event: Dict, context: Any) -> Dict:
     try:
         table = get_table("main")
         
-        filter_expr = "itemType = :it AND direction = :dir"
-        expr_values = {":it": "MESSAGE", ":dir": "INBOUND"}
+        filters = []
+        expr_values = {}
+        expr_names = {}
         
         if from_phone:
-            filter_expr += " AND #f = :from"
+            filters.append("#f = :from")
             expr_values[":from"] = from_phone
+            expr_names["#f"] = "from"
         
         if waba_id:
-            filter_expr += " AND wabaMetaId = :waba"
+            filters.append("wabaMetaId = :waba")
             expr_values[":waba"] = waba_id
         
-        scan_kwargs = {
-            "FilterExpression": filter_expr,
-            "ExpressionAttributeValues": expr_values,
-            "Limit": limit,
-        }
-        
-        if from_phone:
-            scan_kwargs["ExpressionAttributeNames"] = {"#f": "from"}
-        
-        response = table.scan(**scan_kwargs)
-        items = response.get("Items", [])
+        items = list(_read_direction(table, "INBOUND", limit, filters, expr_values, expr_names))
         
         # Sort by receivedAt descending
         items.sort(key=lambda x: x.get("receivedAt", ""), reverse=True)
@@ -178,51 +299,53 @@ def get_outbound_stats(event: Dict, context: Any) -> Dict:
     Test Event:
     {"action": "get_outbound_stats", "days": 7}
     """
-    days = event.get("days", 7)
+    try:
+        days = int(event.get("days", 7))
+    except (TypeError, ValueError):
+        return {"statusCode": 400, "error": "days must be an integer"}
     waba_id = event.get("metaWabaId", "")
     
     try:
         table = get_table("main")
         
-        filter_expr = "itemType = :it AND direction = :dir"
-        expr_values = {":it": "MESSAGE", ":dir": "OUTBOUND"}
+        filters = [f"{_DIRECTION_TIME_ATTR['OUTBOUND']} >= :since"]
+        expr_values = {":since": _since(days)}
         
         if waba_id:
-            filter_expr += " AND wabaMetaId = :waba"
+            filters.append("wabaMetaId = :waba")
             expr_values[":waba"] = waba_id
         
-        response = table.scan(
-            FilterExpression=filter_expr,
-            ExpressionAttributeValues=expr_values,
-            Limit=1000
+        items = _read_direction(
+            table, "OUTBOUND", filters=filters, values=expr_values,
+            names=_OUTBOUND_STATS_NAMES, projection=_OUTBOUND_STATS_PROJECTION,
+            max_pages=STATS_MAX_PAGES,
         )
         
-        items = response.get("Items", [])
-        
-        # Calculate stats
-        total = len(items)
-        by_type = {}
-        by_status = {}
-        by_recipient = {}
+        # Calculate stats page by page; items are never held as a list
+        total = 0
+        by_type = Counter()
+        by_status = Counter()
+        by_recipient = Counter()
         
         for item in items:
+            total += 1
             msg_type = item.get("type", "unknown")
             status = item.get("deliveryStatus", "unknown")
             recipient = item.get("to", "unknown")
             
-            by_type[msg_type] = by_type.get(msg_type, 0) + 1
-            by_status[status] = by_status.get(status, 0) + 1
-            by_recipient[recipient] = by_recipient.get(recipient, 0) + 1
+            by_type[msg_type] += 1
+            by_status[status] += 1
+            by_recipient[recipient] += 1
         
         # Top recipients
-        top_recipients = sorted(by_recipient.items(), key=lambda x: x[1], reverse=True)[:10]
+        top_recipients = by_recipient.most_common(10)
         
         return {
             "statusCode": 200,
             "operation": "get_outbound_stats",
             "total": total,
-            "byType": by_type,
-            "byStatus": by_status,
+            "byType": dict(by_type),
+            "byStatus": dict(by_status),
             "topRecipients": [{"phone": r[0], "count": r[1]} for r in top_recipients],
             "days": days,
         }
@@ -243,34 +366,24 @@ def get_outbound_messages(event: Dict, context: Any) -> Dict:
     try:
         table = get_table("main")
         
-        filter_expr = "itemType = :it AND direction = :dir"
-        expr_values = {":it": "MESSAGE", ":dir": "OUTBOUND"}
+        filters = []
+        expr_values = {}
         expr_names = {}
         
         if to_phone:
-            filter_expr += " AND #to = :to"
+            filters.append("#to = :to")
             expr_values[":to"] = to_phone
             expr_names["#to"] = "to"
         
         if waba_id:
-            filter_expr += " AND wabaMetaId = :waba"
+            filters.append("wabaMetaId = :waba")
             expr_values[":waba"] = waba_id
         
         if status:
-            filter_expr += " AND deliveryStatus = :st"
+            filters.append("deliveryStatus = :st")
             expr_values[":st"] = status
         
-        scan_kwargs = {
-            "FilterExpression": filter_expr,
-            "ExpressionAttributeValues": expr_values,
-            "Limit": limit,
-        }
-        
-        if expr_names:
-            scan_kwargs["ExpressionAttributeNames"] = expr_names
-        
-        response = table.scan(**scan_kwargs)
-        items = response.get("Items", [])
+        items = list(_read_direction(table, "OUTBOUND", limit, filters, expr_values, expr_names))
         
         # Sort by sentAt descending
         items.sort(key=lambda x: x.get("sentAt", x.get("createdAt", "")), reverse=True)
@@ -299,42 +412,44 @@ def get_template_stats(event: Dict, context: Any) -> Dict:
         table = get_table("main")
         
         # Get templates
-        filter_expr = "itemType = :it"
-        expr_values = {":it": "TEMPLATE"}
+        filter_expr = _TEMPLATE_FILTER
+        expr_values = _TEMPLATE_VALUES
         
         if waba_id:
             filter_expr += " AND wabaMetaId = :waba"
-            expr_values[":waba"] = waba_id
+            expr_values = {**_TEMPLATE_VALUES, ":waba": waba_id}
         
-        response = table.scan(
+        templates = _parallel_scan(
+            table,
             FilterExpression=filter_expr,
             ExpressionAttributeValues=expr_values,
-            Limit=500
+            ProjectionExpression=_TEMPLATE_STATS_PROJECTION,
+            ExpressionAttributeNames=_TEMPLATE_STATS_NAMES,
         )
         
-        templates = response.get("Items", [])
-        
         # Calculate stats
-        by_status = {}
-        by_category = {}
-        by_language = {}
+        total = 0
+        by_status = Counter()
+        by_category = Counter()
+        by_language = Counter()
         
         for t in templates:
+            total += 1
             status = t.get("status", "unknown")
             category = t.get("category", "unknown")
             language = t.get("language", "unknown")
             
-            by_status[status] = by_status.get(status, 0) + 1
-            by_category[category] = by_category.get(category, 0) + 1
-            by_language[language] = by_language.get(language, 0) + 1
+            by_status[status] += 1
+            by_category[category] += 1
+            by_language[language] += 1
         
         return {
             "statusCode": 200,
             "operation": "get_template_stats",
-            "total": len(templates),
-            "byStatus": by_status,
-            "byCategory": by_category,
-            "byLanguage": by_language,
+            "total": total,
+            "byStatus": dict(by_status),
+            "byCategory": dict(by_category),
+            "byLanguage": dict(by_language),
         }
     except ClientError as e:
         return {"statusCode": 500, "error": str(e)}
@@ -352,30 +467,32 @@ def get_flow_stats(event: Dict, context: Any) -> Dict:
         table = get_table("main")
         
         # Get flow-related items
-        response = table.scan(
-            FilterExpression="begins_with(pk, :prefix)",
-            ExpressionAttributeValues={":prefix": "FLOW#"},
-            Limit=500
+        items = _parallel_scan(
+            table,
+            FilterExpression=_FLOW_FILTER,
+            ExpressionAttributeValues=_FLOW_VALUES,
+            ProjectionExpression=_FLOW_STATS_PROJECTION,
+            ExpressionAttributeNames=_FLOW_STATS_NAMES,
         )
         
-        items = response.get("Items", [])
-        
-        by_status = {}
-        by_flow_id = {}
+        total = 0
+        by_status = Counter()
+        by_flow_id = Counter()
         
         for item in items:
+            total += 1
             status = item.get("status", "unknown")
             flow_id = item.get("flowId", "unknown")
             
-            by_status[status] = by_status.get(status, 0) + 1
-            by_flow_id[flow_id] = by_flow_id.get(flow_id, 0) + 1
+            by_status[status] += 1
+            by_flow_id[flow_id] += 1
         
         return {
             "statusCode": 200,
             "operation": "get_flow_stats",
-            "total": len(items),
-            "byStatus": by_status,
-            "byFlowId": by_flow_id,
+            "total": total,
+            "byStatus": dict(by_status),
+            "byFlowId": dict(by_flow_id),
         }
     except ClientError as e:
         return {"statusCode": 500, "error": str(e)}
@@ -393,24 +510,25 @@ def get_payment_stats(event: Dict, context: Any) -> Dict:
         table = get_table("payments")
         
         # Get all payments
-        response = table.scan(
-            FilterExpression="#t = :t",
-            ExpressionAttributeNames={"#t": "type"},
-            ExpressionAttributeValues={":t": "PAYMENT"},
-            Limit=500
+        items = _parallel_scan(
+            table,
+            FilterExpression=_TYPE_FILTER,
+            ExpressionAttributeNames=_PAYMENT_STATS_NAMES,
+            ExpressionAttributeValues=_PAYMENT_VALUES,
+            ProjectionExpression=_PAYMENT_STATS_PROJECTION,
         )
         
-        items = response.get("Items", [])
-        
-        by_status = {}
+        total = 0
+        by_status = Counter()
         total_amount = 0
         captured_amount = 0
         
         for item in items:
+            total += 1
             status = item.get("status", "unknown")
             amount = float(item.get("amount", 0))
             
-            by_status[status] = by_status.get(status, 0) + 1
+            by_status[status] += 1
             total_amount += amount
             
             if status == "captured":
@@ -419,8 +537,8 @@ def get_payment_stats(event: Dict, context: Any) -> Dict:
         return {
             "statusCode": 200,
             "operation": "get_payment_stats",
-            "total": len(items),
-            "byStatus": by_status,
+            "total": total,
+            "byStatus": dict(by_status),
             "totalAmount": total_amount,
             "capturedAmount": captured_amount,
             "currency": "INR",
@@ -440,23 +558,23 @@ def get_payments(event: Dict, context: Any) -> Dict:
     try:
         table = get_table("payments")
         
-        filter_expr = "#t = :t"
-        expr_values = {":t": "PAYMENT"}
-        expr_names = {"#t": "type"}
+        filter_expr = _TYPE_FILTER
+        expr_values = _PAYMENT_VALUES
+        expr_names = _TYPE_NAMES
         
         if status:
             filter_expr += " AND #s = :s"
-            expr_values[":s"] = status
-            expr_names["#s"] = "status"
+            expr_values = {**_PAYMENT_VALUES, ":s": status}
+            expr_names = {**_TYPE_NAMES, "#s": "status"}
         
-        response = table.scan(
+        items = list(_iter_items(
+            table.scan,
+            max_items=limit,
             FilterExpression=filter_expr,
             ExpressionAttributeNames=expr_names,
             ExpressionAttributeValues=expr_values,
             Limit=limit
-        )
-        
-        items = response.get("Items", [])
+        ))
         items.sort(key=lambda x: x.get("capturedAt", x.get("createdAt", "")), reverse=True)
         
         return {
@@ -481,19 +599,20 @@ def get_shortlink_stats(event: Dict, context: Any) -> Dict:
         table = get_table("shortlinks")
         
         # Get all links
-        response = table.scan(
-            FilterExpression="#t = :t",
-            ExpressionAttributeNames={"#t": "type"},
-            ExpressionAttributeValues={":t": "LINK"},
-            Limit=500
+        items = _parallel_scan(
+            table,
+            FilterExpression=_TYPE_FILTER,
+            ExpressionAttributeNames=_TYPE_NAMES,
+            ExpressionAttributeValues=_LINK_VALUES,
+            ProjectionExpression=_LINK_STATS_PROJECTION,
         )
         
-        items = response.get("Items", [])
-        
+        total_links = 0
         total_clicks = 0
         active_count = 0
         
         for item in items:
+            total_links += 1
             clicks = int(item.get("clicks", 0))
             active = item.get("active", True)
             
@@ -504,7 +623,7 @@ def get_shortlink_stats(event: Dict, context: Any) -> Dict:
         return {
             "statusCode": 200,
             "operation": "get_shortlink_stats",
-            "totalLinks": len(items),
+            "totalLinks": total_links,
             "activeLinks": active_count,
             "totalClicks": total_clicks,
         }
@@ -522,14 +641,14 @@ def get_shortlinks(event: Dict, context: Any) -> Dict:
     try:
         table = get_table("shortlinks")
         
-        response = table.scan(
-            FilterExpression="#t = :t",
-            ExpressionAttributeNames={"#t": "type"},
-            ExpressionAttributeValues={":t": "LINK"},
+        items = list(_iter_items(
+            table.scan,
+            max_items=limit,
+            FilterExpression=_TYPE_FILTER,
+            ExpressionAttributeNames=_TYPE_NAMES,
+            ExpressionAttributeValues=_LINK_VALUES,
             Limit=limit
-        )
-        
-        items = response.get("Items", [])
+        ))
         items.sort(key=lambda x: int(x.get("clicks", 0)), reverse=True)
         
         return {
@@ -544,6 +663,31 @@ def get_shortlinks(event: Dict, context: Any) -> Dict:
 # =============================================================================
 # COMBINED DASHBOARD
 # =============================================================================
+def _timed(handler, event: Dict, context: Any):
+    """Run a stats handler, returning (result, elapsed ms)."""
+    started = time.perf_counter_ns()
+    result = handler(event, context)
+    return result, (time.perf_counter_ns() - started) // 1_000_000
+
+
+# Summary section -> (stats handler, projection of its result into the summary)
+_SUMMARY_SECTIONS = {
+    "inbound": (get_inbound_stats, lambda r: {
+        "total": r.get("total", 0), "byType": r.get("byType", {})}),
+    "outbound": (get_outbound_stats, lambda r: {
+        "total": r.get("total", 0), "byStatus": r.get("byStatus", {})}),
+    "templates": (get_template_stats, lambda r: {
+        "total": r.get("total", 0), "byStatus": r.get("byStatus", {})}),
+    "payments": (get_payment_stats, lambda r: {
+        "total": r.get("total", 0),
+        "capturedAmount": r.get("capturedAmount", 0),
+        "byStatus": r.get("byStatus", {})}),
+    "shortlinks": (get_shortlink_stats, lambda r: {
+        "totalLinks": r.get("totalLinks", 0),
+        "totalClicks": r.get("totalClicks", 0)}),
+}
+
+
 def get_dashboard_summary(event: Dict, context: Any) -> Dict:
     """Get combined dashboard summary.
     
@@ -556,47 +700,20 @@ def get_dashboard_summary(event: Dict, context: Any) -> Dict:
         "timestamp": now(),
     }
     
-    # Get inbound stats
-    try:
-        inbound = get_inbound_stats(event, context)
-        summary["inbound"] = {"total": inbound.get("total", 0), "byType": inbound.get("byType", {})}
-    except:
-        summary["inbound"] = {"error": "Failed to fetch"}
-    
-    # Get outbound stats
-    try:
-        outbound = get_outbound_stats(event, context)
-        summary["outbound"] = {"total": outbound.get("total", 0), "byStatus": outbound.get("byStatus", {})}
-    except:
-        summary["outbound"] = {"error": "Failed to fetch"}
-    
-    # Get template stats
-    try:
-        templates = get_template_stats(event, context)
-        summary["templates"] = {"total": templates.get("total", 0), "byStatus": templates.get("byStatus", {})}
-    except:
-        summary["templates"] = {"error": "Failed to fetch"}
-    
-    # Get payment stats
-    try:
-        payments = get_payment_stats(event, context)
-        summary["payments"] = {
-            "total": payments.get("total", 0),
-            "capturedAmount": payments.get("capturedAmount", 0),
-            "byStatus": payments.get("byStatus", {})
-        }
-    except:
-        summary["payments"] = {"error": "Failed to fetch"}
+    # The five sections read independent tables/partitions - fetch them concurrently
+    pool = get_pool()
+    futures = {
+        section: pool.submit(_timed, handler, event, context)
+        for section, (handler, _) in _SUMMARY_SECTIONS.items()
+    }
     
-    # Get shortlink stats
-    try:
-        shortlinks = get_shortlink_stats(event, context)
-        summary["shortlinks"] = {
-            "totalLinks": shortlinks.get("totalLinks", 0),
-            "totalClicks": shortlinks.get("totalClicks", 0)
-        }
-    except:
-        summary["shortlinks"] = {"error": "Failed to fetch"}
+    for section, future in futures.items():
+        try:
+            result, duration_ms = future.result(timeout=SUMMARY_SECTION_TIMEOUT)
+            summary[section] = {**_SUMMARY_SECTIONS[section][1](result), "durationMs": duration_ms}
+        except Exception as e:
+            logger.warning("summary.section_failed section=%s err=%s", section, e)
+            summary[section] = {"error": "Failed to fetch"}
     
     return summary
 
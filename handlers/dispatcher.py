@@ -22,20 +22,75 @@
 #     result = unified_dispatch(action, event, context)
 # =============================================================================
 
+import atexit
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Tuple
 from functools import wraps
+from itertools import islice
 
 logger = logging.getLogger()
 
 # Type definitions
 HandlerFunc = Callable[[Dict[str, Any], Any], Dict[str, Any]]
 
+
+@dataclass(frozen=True, slots=True)
+class HandlerMeta:
+    """Registration metadata for one action."""
+    category: str
+    description: str
+    requires: Tuple[str, ...]
+    deprecated: bool
+    module: str
+    function: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form for JSON responses (requires as a list)."""
+        return {
+            "category": self.category,
+            "description": self.description,
+            "requires": list(self.requires),
+            "deprecated": self.deprecated,
+            "module": self.module,
+            "function": self.function,
+        }
+
+
 # =============================================================================
 # GLOBAL REGISTRY
 # =============================================================================
 _REGISTRY: Dict[str, HandlerFunc] = {}
-_METADATA: Dict[str, Dict[str, Any]] = {}
+_METADATA: Dict[str, HandlerMeta] = {}
+
+# Per-action dispatch checks, precomputed at registration; absent = nothing to check
+_REQUIRED: Dict[str, Tuple[str, ...]] = {}
+_DEPRECATED: set = set()
+
+# category -> actions in registration order (dict used as an ordered set)
+_CATEGORY_INDEX: Dict[str, Dict[str, None]] = {}
+
+# Bumped on every registry mutation; derived views are cached against it
+_REGISTRY_VERSION = 0
+_AVAILABLE_ACTIONS_CACHE: Tuple[int, Tuple[str, ...]] = (-1, ())
+_HELP_CACHE: Optional[Tuple[int, Dict[str, Any]]] = None
+
+# Shared fan-out pool for handlers doing parallel IO; threads persist across
+# warm invocations. Work submitted here must not itself block on this pool.
+HANDLER_POOL_SIZE = int(os.environ.get("HANDLER_POOL", "8"))
+_POOL = ThreadPoolExecutor(
+    max_workers=HANDLER_POOL_SIZE,
+    thread_name_prefix="hdlr",
+)
+atexit.register(_POOL.shutdown, wait=False)
+
+
+def get_pool() -> ThreadPoolExecutor:
+    """Return the process-wide handler thread pool."""
+    return _POOL
+
 
 # Handler categories with descriptions
 CATEGORIES = {
@@ -58,6 +113,42 @@ CATEGORIES = {
 }
 
 
+def _set_checks(action: str, requires: Optional[List[str]], deprecated: bool) -> None:
+    """Record the dispatch-time checks for an action (or clear them on re-registration)."""
+    global _REGISTRY_VERSION
+    _REGISTRY_VERSION += 1
+    if requires:
+        _REQUIRED[action] = tuple(requires)
+    else:
+        _REQUIRED.pop(action, None)
+    if deprecated:
+        _DEPRECATED.add(action)
+    else:
+        _DEPRECATED.discard(action)
+
+
+def _describe(action: str, func: HandlerFunc, description: Optional[str]) -> str:
+    """Explicit description, else first docstring line, else a generic one."""
+    if description:
+        return description
+    if func.__doc__:
+        desc = func.__doc__.split("\n", 1)[0].strip()
+        if desc:
+            return desc
+    return f"Handle {action} action"
+
+
+def _index_category(action: str, category: str) -> None:
+    """File an action under its category, moving it if it was re-registered elsewhere."""
+    previous = _METADATA.get(action)
+    if previous and previous.category != category:
+        old = _CATEGORY_INDEX.get(previous.category, {})
+        old.pop(action, None)
+        if not old:
+            _CATEGORY_INDEX.pop(previous.category, None)
+    _CATEGORY_INDEX.setdefault(category, {})[action] = None
+
+
 # =============================================================================
 # REGISTRATION DECORATOR
 # =============================================================================
@@ -80,23 +171,19 @@ def register(action: str, category: str = "general", description: str = None,
             return {"statusCode": 200}
     """
     def decorator(func: HandlerFunc) -> HandlerFunc:
-        # Extract description from docstring if not provided
-        desc = description
-        if not desc and func.__doc__:
-            desc = func.__doc__.split("\n")[0].strip()
-        if not desc:
-            desc = f"Handle {action} action"
+        desc = _describe(action, func, description)
         
         # Register handler
         _REGISTRY[action] = func
-        _METADATA[action] = {
-            "category": category,
-            "description": desc,
-            "requires": requires or [],
-            "deprecated": deprecated,
-            "module": func.__module__,
-            "function": func.__name__,
-        }
+        _set_checks(action, requires, deprecated)
+        _index_category(action, category)
+        _METADATA[action] = HandlerMeta(
+            category, desc, tuple(requires or ()), deprecated, func.__module__, func.__name__,
+        )
+        
+        # Nothing to check - direct callers get the raw function, no extra frame
+        if not requires and not deprecated:
+            return func
         
         @wraps(func)
         def wrapper(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -136,32 +223,43 @@ def register_handler(action: str, handler: HandlerFunc, category: str = "general
         description: Short description
         requires: List of required event fields
     """
-    desc = description
-    if not desc and handler.__doc__:
-        desc = handler.__doc__.split("\n")[0].strip()
-    if not desc:
-        desc = f"Handle {action} action"
+    desc = _describe(action, handler, description)
     
     _REGISTRY[action] = handler
-    _METADATA[action] = {
-        "category": category,
-        "description": desc,
-        "requires": requires or [],
-        "deprecated": False,
-        "module": handler.__module__,
-        "function": handler.__name__,
-    }
+    _set_checks(action, requires, False)
+    _index_category(action, category)
+    _METADATA[action] = HandlerMeta(
+        category, desc, tuple(requires or ()), False, handler.__module__, handler.__name__,
+    )
 
 
 def register_bulk(handlers: Dict[str, Tuple[HandlerFunc, str, str]]):
     """
     Register multiple handlers at once.
     
+    Builds the metadata in one pass and applies it with bulk dict updates,
+    bumping the registry version once rather than per handler.
+    
     Args:
         handlers: Dict of {action: (handler_func, category, description)}
     """
+    global _REGISTRY_VERSION
+    metadata = {}
     for action, (handler, category, description) in handlers.items():
-        register_handler(action, handler, category, description)
+        _index_category(action, category)
+        metadata[action] = HandlerMeta(
+            category, _describe(action, handler, description), (), False,
+            handler.__module__, handler.__name__,
+        )
+    
+    _REGISTRY.update({action: entry[0] for action, entry in handlers.items()})
+    _METADATA.update(metadata)
+    # Same semantics as register_handler: bulk entries carry no checks
+    if _REQUIRED:
+        for action in handlers:
+            _REQUIRED.pop(action, None)
+    _DEPRECATED.difference_update(handlers)
+    _REGISTRY_VERSION += 1
 
 
 # =============================================================================
@@ -185,19 +283,34 @@ def unified_dispatch(action: str, event: Dict[str, Any], context: Any) -> Option
     # Ensure extended handlers are loaded
     _init_extended_handlers()
     
-    logger.info(f"unified_dispatch: action={action}, registry_size={len(_REGISTRY)}")
+    # %-style args: messages are only formatted if INFO is enabled
+    logger.info("unified_dispatch: action=%s, registry_size=%d", action, len(_REGISTRY))
     
-    handler = _REGISTRY.get(action)
-    if handler:
-        logger.info(f"Found handler for action: {action}")
-        try:
-            return handler(event, context)
-        except Exception as e:
-            logger.exception(f"Handler error for action '{action}': {e}")
-            return {"statusCode": 500, "error": f"Internal error: {str(e)}"}
+    try:
+        handler = _REGISTRY[action]
+    except KeyError:
+        logger.info("No handler found for action: %s", action)
+        return None
+    
+    logger.info("Found handler for action: %s", action)
+    
+    if action in _DEPRECATED:
+        logger.warning("Action '%s' is deprecated", action)
     
-    logger.info(f"No handler found for action: {action}")
-    return None
+    required = _REQUIRED.get(action)
+    if required is not None:
+        missing = [f for f in required if not event.get(f)]
+        if missing:
+            return {
+                "statusCode": 400,
+                "error": f"Missing required fields: {', '.join(missing)}"
+            }
+    
+    try:
+        return handler(event, context)
+    except Exception as e:
+        logger.exception("Handler error for action '%s': %s", action, e)
+        return {"statusCode": 500, "error": f"Internal error: {str(e)}"}
 
 
 def dispatch_with_validation(action: str, event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -213,12 +326,22 @@ def dispatch_with_validation(action: str, event: Dict[str, Any], context: Any) -
         return {
             "statusCode": 400,
             "error": f"Unknown action: {action}",
-            "availableActions": list(_REGISTRY.keys())[:20],
+            "availableActions": list(_available_actions()),
             "hint": "Use action='help' to see all available actions"
         }
     return unified_dispatch(action, event, context)
 
 
+def _available_actions() -> Tuple[str, ...]:
+    """First 20 registered actions, rebuilt only when the registry has changed."""
+    global _AVAILABLE_ACTIONS_CACHE
+    version, actions = _AVAILABLE_ACTIONS_CACHE
+    if version != _REGISTRY_VERSION:
+        actions = tuple(islice(_REGISTRY, 20))
+        _AVAILABLE_ACTIONS_CACHE = (_REGISTRY_VERSION, actions)
+    return actions
+
+
 # =============================================================================
 # QUERY FUNCTIONS
 # =============================================================================
@@ -234,36 +357,35 @@ def handler_exists(action: str) -> bool:
 
 def get_handler_metadata(action: str) -> Optional[Dict[str, Any]]:
     """Get metadata for a handler."""
-    return _METADATA.get(action)
+    meta = _METADATA.get(action)
+    return meta.to_dict() if meta else None
 
 
 def list_all_actions() -> Dict[str, str]:
     """List all registered actions with descriptions."""
     return {
-        action: meta["description"]
+        action: meta.description
         for action, meta in _METADATA.items()
-        if not meta.get("deprecated")
+        if action not in _DEPRECATED
     }
 
 
 def list_actions_by_category() -> Dict[str, List[str]]:
     """Get actions grouped by category."""
-    categories: Dict[str, List[str]] = {}
-    for action, meta in _METADATA.items():
-        if meta.get("deprecated"):
-            continue
-        cat = meta.get("category", "general")
-        if cat not in categories:
-            categories[cat] = []
-        categories[cat].append(action)
-    return categories
+    if not _DEPRECATED:
+        return {cat: list(actions) for cat, actions in _CATEGORY_INDEX.items()}
+    categories = {
+        cat: [action for action in actions if action not in _DEPRECATED]
+        for cat, actions in _CATEGORY_INDEX.items()
+    }
+    return {cat: actions for cat, actions in categories.items() if actions}
 
 
 def get_category_actions(category: str) -> List[str]:
     """Get all actions for a specific category."""
     return [
-        action for action, meta in _METADATA.items()
-        if meta.get("category") == category and not meta.get("deprecated")
+        action for action in _CATEGORY_INDEX.get(category, ())
+        if action not in _DEPRECATED
     ]
 
 
@@ -274,23 +396,31 @@ def get_handler_count() -> int:
 
 def get_deprecated_actions() -> List[str]:
     """Get list of deprecated actions."""
-    return [
-        action for action, meta in _METADATA.items()
-        if meta.get("deprecated")
-    ]
+    if not _DEPRECATED:
+        return []
+    # Registration order, as before; the set membership test replaces meta lookups
+    return [action for action in _METADATA if action in _DEPRECATED]
 
 
 # =============================================================================
 # DOCUMENTATION GENERATION
 # =============================================================================
 def generate_help() -> Dict[str, Any]:
-    """Generate comprehensive help documentation."""
+    """Generate comprehensive help documentation.
+    
+    The result is cached until the registry changes and shared between
+    callers - treat it as read-only.
+    """
+    global _HELP_CACHE
+    if _HELP_CACHE and _HELP_CACHE[0] == _REGISTRY_VERSION:
+        return _HELP_CACHE[1]
+    
     by_category = list_actions_by_category()
     
     help_doc = {
         "totalActions": get_handler_count(),
         "categories": {},
-        "deprecatedCount": len(get_deprecated_actions()),
+        "deprecatedCount": len(_DEPRECATED),
     }
     
     for category, actions in sorted(by_category.items()):
@@ -299,11 +429,12 @@ def generate_help() -> Dict[str, Any]:
             "description": cat_desc,
             "actionCount": len(actions),
             "actions": {
-                action: _METADATA[action]["description"]
+                action: _METADATA[action].description
                 for action in sorted(actions)
             }
         }
     
+    _HELP_CACHE = (_REGISTRY_VERSION, help_doc)
     return help_doc
 
 
@@ -317,11 +448,8 @@ def generate_action_docs(action: str) -> Optional[Dict[str, Any]]:
     
     return {
         "action": action,
-        "category": meta["category"],
-        "description": meta["description"],
-        "requiredFields": meta["requires"],
-        "deprecated": meta["deprecated"],
-        "module": meta["module"],
+        **meta.to_dict(),
+        "requiredFields": list(meta.requires),
         "docstring": handler.__doc__ if handler else None,
     }
 
@@ -331,35 +459,33 @@ def generate_action_docs(action: str) -> Optional[Dict[str, Any]]:
 # =============================================================================
 _extended_initialized = False
 
+def _extended_handlers_ready() -> None:
+    """Stand-in for _init_extended_handlers once initialization has run."""
+
+
 def _init_extended_handlers():
-    """Initialize extended handlers from handlers/extended.py."""
-    global _extended_initialized
+    """Initialize extended handlers from handlers/extended.py.
+    
+    Rebinds the module name to a no-op on first call, so every later
+    dispatch pays a plain call instead of a flag check.
+    """
+    global _extended_initialized, _init_extended_handlers
     if _extended_initialized:
         return
     _extended_initialized = True
+    _init_extended_handlers = _extended_handlers_ready
     
     try:
         logger.info("Initializing extended handlers...")
-        from handlers.extended import EXTENDED_HANDLERS, get_extended_actions_by_category
+        from handlers.extended import EXTENDED_HANDLERS, ACTION_TO_CATEGORY
         
         logger.info(f"Found {len(EXTENDED_HANDLERS)} extended handlers to register")
         
-        # Get category mapping
-        categories = get_extended_actions_by_category()
-        action_to_category = {}
-        for cat, actions in categories.items():
-            # Normalize category name
-            cat_key = cat.lower().replace(" & ", "_").replace(" ", "_")
-            for action in actions:
-                action_to_category[action] = cat_key
-        
-        # Register all extended handlers
-        for action, handler in EXTENDED_HANDLERS.items():
-            category = action_to_category.get(action, "extended")
-            desc = None
-            if handler.__doc__:
-                desc = handler.__doc__.split("\n")[0].strip()
-            register_handler(action, handler, category, desc)
+        # Register all extended handlers in one bulk update
+        register_bulk({
+            action: (handler, ACTION_TO_CATEGORY.get(action, "extended"), None)
+            for action, handler in EXTENDED_HANDLERS.items()
+        })
         
         logger.info(f"Registered {len(EXTENDED_HANDLERS)} extended handlers successfully")
     except ImportError as e:
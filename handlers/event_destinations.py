@@ -8,13 +8,23 @@ import json
 import logging
 from typing import Any, Dict
 from handlers.base import (
-    table, MESSAGES_PK_NAME, iso_now, store_item, get_item,
-    validate_required_fields, get_sns
+    table, MESSAGES_PK_NAME, iso_now, store_item, get_item, get_items_batch,
+    validate_required_fields, get_sns, paginate_items
 )
 from botocore.exceptions import ClientError
 
 logger = logging.getLogger()
 
+# Sparse GSI: PK eventDestWaba, which only EVENT_DESTINATION items carry, so a
+# query reads just that WABA's destinations.
+# Migration: destinations created before the index carry no eventDestWaba -
+# run the backfill_event_destinations action once before creating the GSI.
+EVENT_DEST_GSI = "gsi_event_dest"
+_EVENT_DEST_KEY = "eventDestWaba = :waba"
+_EVENT_DEST_ITEM_FILTER = "itemType = :it"
+_EVENT_DEST_FILTER = "itemType = :it AND wabaMetaId = :waba"
+_EVENT_DEST_BACKFILL_FILTER = "itemType = :it AND attribute_not_exists(eventDestWaba)"
+
 
 def handle_create_event_destination(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Create SNS event destination for WhatsApp webhooks.
@@ -48,6 +58,7 @@ def handle_create_event_destination(event: Dict[str, Any], context: Any) -> Dict
             MESSAGES_PK_NAME: dest_pk,
             "itemType": "EVENT_DESTINATION",
             "wabaMetaId": meta_waba_id,
+            "eventDestWaba": meta_waba_id,
             "destinationType": destination_type,
             "snsTopicArn": sns_topic_arn,
             "eventTypes": event_types,
@@ -83,21 +94,69 @@ def handle_get_event_destinations(event: Dict[str, Any], context: Any) -> Dict[s
         return error
     
     try:
-        response = table().scan(
-            FilterExpression="itemType = :it AND wabaMetaId = :waba",
-            ExpressionAttributeValues={":it": "EVENT_DESTINATION", ":waba": meta_waba_id}
-        )
+        try:
+            items = paginate_items(
+                "query",
+                IndexName=EVENT_DEST_GSI,
+                KeyConditionExpression=_EVENT_DEST_KEY,
+                FilterExpression=_EVENT_DEST_ITEM_FILTER,
+                ExpressionAttributeValues={":it": "EVENT_DESTINATION", ":waba": meta_waba_id},
+            )
+        except ClientError as e:
+            # If GSI doesn't exist, fall back to scan
+            if "ValidationException" not in str(e):
+                raise
+            logger.warning(f"{EVENT_DEST_GSI} unavailable, falling back to scan")
+            items = paginate_items(
+                "scan",
+                FilterExpression=_EVENT_DEST_FILTER,
+                ExpressionAttributeValues={":it": "EVENT_DESTINATION", ":waba": meta_waba_id},
+            )
         
         return {
             "statusCode": 200,
             "operation": "get_event_destinations",
-            "count": len(response.get("Items", [])),
-            "destinations": response.get("Items", [])
+            "count": len(items),
+            "destinations": items
         }
     except ClientError as e:
         return {"statusCode": 500, "error": str(e)}
 
 
+def handle_get_event_destinations_multi(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """Get specific event destinations for one or more WABAs in a single batch read.
+    
+    Test Event:
+    {
+        "action": "get_event_destinations_multi",
+        "metaWabaIds": ["1347766229904230"],
+        "destinationTypes": ["SNS", "EVENTBRIDGE"]
+    }
+    """
+    meta_waba_ids = event.get("metaWabaIds") or [event.get("metaWabaId", "")]
+    destination_types = event.get("destinationTypes", ["SNS"])
+    
+    # A bare string would be iterated per character into bogus keys
+    if not isinstance(meta_waba_ids, list) or not isinstance(destination_types, list):
+        return {"statusCode": 400, "error": "metaWabaIds and destinationTypes must be lists"}
+    if not any(meta_waba_ids):
+        return {"statusCode": 400, "error": "metaWabaIds must contain at least one non-empty id"}
+    
+    # One key per WABA x type, fetched with BatchGetItem instead of N get_item calls
+    items = get_items_batch([
+        f"EVENT_DEST#{waba_id}#{destination_type}"
+        for waba_id in meta_waba_ids if waba_id
+        for destination_type in destination_types
+    ])
+    
+    return {
+        "statusCode": 200,
+        "operation": "get_event_destinations_multi",
+        "count": len(items),
+        "destinations": items
+    }
+
+
 def handle_update_event_destination(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Update event destination configuration.
     
@@ -123,25 +182,34 @@ def handle_update_event_destination(event: Dict[str, Any], context: Any) -> Dict
     now = iso_now()
     
     try:
-        update_expr = "SET lastUpdatedAt = :lu"
-        expr_values = {":lu": now}
+        # Also (re)sets the sparse-GSI key so pre-index destinations get backfilled
+        sets = ["lastUpdatedAt = :lu", "eventDestWaba = :waba"]
+        expr_values = {":lu": now, ":waba": meta_waba_id}
         
         if event_types:
-            update_expr += ", eventTypes = :et"
+            sets.append("eventTypes = :et")
             expr_values[":et"] = event_types
         if status:
-            update_expr += ", #st = :st"
+            sets.append("#st = :st")
             expr_values[":st"] = status
         
-        update_kwargs = {
-            "Key": {MESSAGES_PK_NAME: dest_pk},
-            "UpdateExpression": update_expr,
-            "ExpressionAttributeValues": expr_values
-        }
+        expr_names = {"#pk": MESSAGES_PK_NAME}
         if status:
-            update_kwargs["ExpressionAttributeNames"] = {"#st": "status"}
+            expr_names["#st"] = "status"
         
-        table().update_item(**update_kwargs)
+        try:
+            table().update_item(
+                Key={MESSAGES_PK_NAME: dest_pk},
+                UpdateExpression="SET " + ", ".join(sets),
+                # Never upsert: a missing destination must not become a keyless phantom item
+                ConditionExpression="attribute_exists(#pk)",
+                ExpressionAttributeNames=expr_names,
+                ExpressionAttributeValues=expr_values,
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+                return {"statusCode": 404, "error": f"Event destination not found: {destination_type}"}
+            raise
         
         return {
             "statusCode": 200,
@@ -154,6 +222,45 @@ def handle_update_event_destination(event: Dict[str, Any], context: Any) -> Dict
         return {"statusCode": 500, "error": str(e)}
 
 
+def handle_backfill_event_destinations(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """One-off migration: set eventDestWaba on destinations created before gsi_event_dest.
+    
+    Idempotent - only items still missing the attribute are touched. Run it
+    before creating the GSI so no destination drops out of get_event_destinations.
+    
+    Test Event:
+    {"action": "backfill_event_destinations"}
+    """
+    try:
+        items = paginate_items(
+            "scan",
+            FilterExpression=_EVENT_DEST_BACKFILL_FILTER,
+            ExpressionAttributeValues={":it": "EVENT_DESTINATION"},
+            ProjectionExpression="#pk, wabaMetaId",
+            ExpressionAttributeNames={"#pk": MESSAGES_PK_NAME},
+        )
+        
+        updated = 0
+        for item in items:
+            if not item.get("wabaMetaId"):
+                continue
+            table().update_item(
+                Key={MESSAGES_PK_NAME: item[MESSAGES_PK_NAME]},
+                UpdateExpression="SET eventDestWaba = :waba",
+                ExpressionAttributeValues={":waba": item["wabaMetaId"]},
+            )
+            updated += 1
+        
+        return {
+            "statusCode": 200,
+            "operation": "backfill_event_destinations",
+            "scanned": len(items),
+            "updated": updated
+        }
+    except ClientError as e:
+        return {"statusCode": 500, "error": str(e)}
+
+
 def handle_delete_event_destination(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Delete event destination.
     
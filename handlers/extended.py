@@ -114,6 +114,7 @@ from handlers.calling import (
     handle_initiate_call,
     handle_update_call_status,
     handle_get_call_logs,
+    handle_backfill_call_stats,
     handle_update_call_settings,
     handle_get_call_settings,
     handle_create_call_deeplink,
@@ -144,6 +145,7 @@ from handlers.catalogs import (
     handle_upload_catalog,
     handle_get_catalog_products,
     handle_send_catalog_message,
+    handle_backfill_catalog_products,
 )
 
 # Payments Handlers
@@ -247,6 +249,7 @@ from handlers.flows_messaging import (
 # Carousel Message Handlers
 from handlers.carousels import (
     handle_send_media_carousel,
+    handle_send_media_carousel_bulk,
     handle_send_product_carousel,
     handle_send_single_product,
 )
@@ -271,6 +274,8 @@ from handlers.template_library import (
 from handlers.event_destinations import (
     handle_create_event_destination,
     handle_get_event_destinations,
+    handle_get_event_destinations_multi,
+    handle_backfill_event_destinations,
     handle_update_event_destination,
     handle_delete_event_destination,
     handle_test_event_destination,
@@ -417,6 +422,7 @@ EXTENDED_HANDLERS: Dict[str, Any] = {
     "initiate_call": handle_initiate_call,
     "update_call_status": handle_update_call_status,
     "get_call_logs": handle_get_call_logs,
+    "backfill_call_stats": handle_backfill_call_stats,
     "update_call_settings": handle_update_call_settings,
     "get_call_settings": handle_get_call_settings,
     "create_call_deeplink": handle_create_call_deeplink,
@@ -447,6 +453,7 @@ EXTENDED_HANDLERS: Dict[str, Any] = {
     "upload_catalog": handle_upload_catalog,
     "get_catalog_products": handle_get_catalog_products,
     "send_catalog_message": handle_send_catalog_message,
+    "backfill_catalog_products": handle_backfill_catalog_products,
     
     # -------------------------------------------------------------------------
     # Payments
@@ -550,6 +557,7 @@ EXTENDED_HANDLERS: Dict[str, Any] = {
     # Carousels
     # -------------------------------------------------------------------------
     "send_media_carousel": handle_send_media_carousel,
+    "send_media_carousel_bulk": handle_send_media_carousel_bulk,
     "send_product_carousel": handle_send_product_carousel,
     "send_single_product": handle_send_single_product,
     
@@ -574,6 +582,8 @@ EXTENDED_HANDLERS: Dict[str, Any] = {
     # -------------------------------------------------------------------------
     "create_event_destination": handle_create_event_destination,
     "get_event_destinations": handle_get_event_destinations,
+    "get_event_destinations_multi": handle_get_event_destinations_multi,
+    "backfill_event_destinations": handle_backfill_event_destinations,
     "update_event_destination": handle_update_event_destination,
     "delete_event_destination": handle_delete_event_destination,
     "test_event_destination": handle_test_event_destination,
@@ -660,7 +670,7 @@ def list_extended_actions() -> Dict[str, str]:
     actions = {}
     for action, handler in EXTENDED_HANDLERS.items():
         doc = handler.__doc__ or "No description"
-        first_line = doc.split("\n")[0].strip()
+        first_line = doc.split("\n", 1)[0].strip()
         actions[action] = first_line
     return actions
 
@@ -749,6 +759,7 @@ def get_extended_actions_by_category() -> Dict[str, List[str]]:
             "initiate_call",
             "update_call_status",
             "get_call_logs",
+            "backfill_call_stats",
             "update_call_settings",
             "get_call_settings",
             "create_call_deeplink",
@@ -773,6 +784,7 @@ def get_extended_actions_by_category() -> Dict[str, List[str]]:
             "upload_catalog",
             "get_catalog_products",
             "send_catalog_message",
+            "backfill_catalog_products",
         ],
         "Payments": [
             "payment_onboarding",
@@ -857,6 +869,7 @@ def get_extended_actions_by_category() -> Dict[str, List[str]]:
         ],
         "Carousels": [
             "send_media_carousel",
+            "send_media_carousel_bulk",
             "send_product_carousel",
             "send_single_product",
         ],
@@ -875,6 +888,8 @@ def get_extended_actions_by_category() -> Dict[str, List[str]]:
         "AWS Event Destinations": [
             "create_event_destination",
             "get_event_destinations",
+            "get_event_destinations_multi",
+            "backfill_event_destinations",
             "update_event_destination",
             "delete_event_destination",
             "test_event_destination",
@@ -927,6 +942,19 @@ def get_extended_actions_by_category() -> Dict[str, List[str]]:
     }
 
 
+def _category_key(category: str) -> str:
+    """Normalize a display category ("Query & Search") to a registry key ("query_search")."""
+    return category.lower().replace(" & ", "_").replace(" ", "_")
+
+
+# action -> normalized category, inverted once at import for the dispatcher
+ACTION_TO_CATEGORY: Dict[str, str] = {
+    action: _category_key(category)
+    for category, actions in get_extended_actions_by_category().items()
+    for action in actions
+}
+
+
 def get_extended_handler_count() -> int:
     """Get total count of extended handlers."""
     return len(EXTENDED_HANDLERS)
@@ -35,7 +35,7 @@ def register(action: str, category: str = "general", description: str = None, re
     def decorator(func: HandlerFunc) -> HandlerFunc:
         desc = description
         if not desc and func.__doc__:
-            desc = func.__doc__.split("\n")[0].strip()
+            desc = func.__doc__.split("\n", 1)[0].strip()
         if not desc:
             desc = f"Handle {action} action"
         
@@ -56,7 +56,7 @@ def register_handler(action: str, handler: HandlerFunc, category: str = "general
     """Manually register a handler function."""
     desc = description
     if not desc and handler.__doc__:
-        desc = handler.__doc__.split("\n")[0].strip()
+        desc = handler.__doc__.split("\n", 1)[0].strip()
     if not desc:
         desc = f"Handle {action} action"
     
@@ -215,23 +215,15 @@ def _ensure_handlers_loaded():
         logger.info("Loading handlers into unified registry...")
         
         # Import extended handlers from existing system
-        from handlers.extended import EXTENDED_HANDLERS, get_extended_actions_by_category
-        
-        # Get category mapping
-        categories = get_extended_actions_by_category()
-        action_to_category = {}
-        for cat, actions in categories.items():
-            cat_key = cat.lower().replace(" & ", "_").replace(" ", "_")
-            for action in actions:
-                action_to_category[action] = cat_key
+        from handlers.extended import EXTENDED_HANDLERS, ACTION_TO_CATEGORY
         
         # Register all extended handlers
         for action, handler in EXTENDED_HANDLERS.items():
             if action not in _HANDLERS:
-                category = action_to_category.get(action, "extended")
+                category = ACTION_TO_CATEGORY.get(action, "extended")
                 desc = None
                 if handler.__doc__:
-                    desc = handler.__doc__.split("\n")[0].strip()
+                    desc = handler.__doc__.split("\n", 1)[0].strip()
                 
                 # Wrap handler to accept (payload, deps) signature
                 wrapped = _wrap_legacy_handler(handler)